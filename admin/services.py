@@ -5,12 +5,15 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, desc, asc, and_, or_, text, case
 from sqlalchemy.exc import IntegrityError
 
+from core.cache import invalidate_cache
 from core.exceptions import (
     NotFoundException, 
     ValidationException, 
     ConflictException
 )
 from models import Product, Category, User, Order, OrderItem, Promotion
+from products.services import PRODUCT_CACHE_PREFIXES
+from promotions.services import PROMOTION_CACHE_PREFIXES
 from admin.schemas import (
     AdminProductResponse, AdminProductListResponse, AdminProductFilter,
     AdminProductCreate, AdminProductUpdate, AdminProductCreateRequest,
@@ -230,6 +233,7 @@ class AdminService:
             self.db.add(new_product)
             self.db.commit()
             self.db.refresh(new_product)
+            invalidate_cache(*PRODUCT_CACHE_PREFIXES)
             
             # Log admin activity
             self._log_admin_activity(
@@ -289,6 +293,7 @@ class AdminService:
             
             self.db.commit()
             self.db.refresh(product)
+            invalidate_cache(*PRODUCT_CACHE_PREFIXES)
             
             # Log admin activity
             self._log_admin_activity(
@@ -333,6 +338,7 @@ class AdminService:
             # Delete product
             self.db.delete(product)
             self.db.commit()
+            invalidate_cache(*PRODUCT_CACHE_PREFIXES)
             
             return True
             
@@ -365,6 +371,7 @@ class AdminService:
             }, synchronize_session=False)
             
             self.db.commit()
+            invalidate_cache(*PRODUCT_CACHE_PREFIXES)
             
             # Log admin activity
             self._log_admin_activity(
@@ -941,6 +948,7 @@ class AdminService:
             self.db.add(new_promotion)
             self.db.commit()
             self.db.refresh(new_promotion)
+            invalidate_cache(*PROMOTION_CACHE_PREFIXES)
             
             # Log admin activity
             self._log_admin_activity(
@@ -983,6 +991,7 @@ class AdminService:
             
             self.db.commit()
             self.db.refresh(promotion)
+            invalidate_cache(*PROMOTION_CACHE_PREFIXES)
             
             # Log admin activity
             self._log_admin_activity(
@@ -1028,6 +1037,7 @@ class AdminService:
             # Delete promotion
             self.db.delete(promotion)
             self.db.commit()
+            invalidate_cache(*PROMOTION_CACHE_PREFIXES)
             
             return True
             
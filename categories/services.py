@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, asc, and_, or_, text
+from sqlalchemy import func, desc, asc, and_, or_, text, select, literal_column
 from sqlalchemy.exc import IntegrityError
 
 from core.exceptions import (
@@ -10,7 +10,10 @@ from core.exceptions import (
     ValidationException, 
     ConflictException
 )
+from core.cache import invalidate_cache
 from models import Category, Product, OrderItem, Order
+from services import clear_category_cache
+from products.services import PRODUCT_CACHE_PREFIXES
 from categories.schemas import (
     CategoryResponse, CategoryListResponse, CategoryWithProductsResponse,
     ProductResponse, CategoryStatsResponse, CategoryHierarchyResponse,
@@ -514,11 +517,21 @@ class CategoryService:
     
     def _build_breadcrumb(self, category: Category) -> List[CategoryResponse]:
         """Build breadcrumb navigation for a category"""
-        breadcrumb = []
-        current = category
+        # Collect the category and all its ancestors in one recursive query
+        ancestry = select(
+            Category.category_id, Category.parent_category_id, literal_column("0").label("depth")
+        ).where(Category.category_id == category.category_id).cte(name="breadcrumb", recursive=True)
+        
+        ancestry = ancestry.union_all(
+            select(Category.category_id, Category.parent_category_id, ancestry.c.depth + 1)
+            .join(ancestry, Category.category_id == ancestry.c.parent_category_id)
+        )
+        
+        ancestors = self.db.query(Category).join(ancestry, Category.category_id == ancestry.c.category_id)\
+                           .order_by(desc(ancestry.c.depth)).all()
         
-        while current:
-            breadcrumb.insert(0, CategoryResponse(
+        return [
+            CategoryResponse(
                 category_id=str(current.category_id),
                 category_name=current.category_name,
                 description=current.description,
@@ -528,14 +541,9 @@ class CategoryService:
                 sort_order=current.sort_order,
                 created_at=current.created_at,
                 updated_at=current.updated_at
-            ))
-            
-            if current.parent_category_id:
-                current = self.db.query(Category).filter(Category.category_id == current.parent_category_id).first()
-            else:
-                break
-        
-        return breadcrumb
+            )
+            for current in ancestors
+        ]
     
     # =============================================================================
     # CATEGORY MANAGEMENT (ADMIN FUNCTIONS)
@@ -564,6 +572,9 @@ class CategoryService:
         self.db.add(new_category)
         self.db.commit()
         self.db.refresh(new_category)
+        clear_category_cache()
+        # Cached product payloads carry the category name
+        invalidate_cache(*PRODUCT_CACHE_PREFIXES)
         
         return self.get_category_by_id(str(new_category.category_id))
     
@@ -592,6 +603,9 @@ class CategoryService:
         
         self.db.commit()
         self.db.refresh(category)
+        clear_category_cache()
+        # Cached product payloads carry the category name
+        invalidate_cache(*PRODUCT_CACHE_PREFIXES)
         
         return self.get_category_by_id(category_id)
     
@@ -616,6 +630,9 @@ class CategoryService:
         category.updated_at = datetime.utcnow()
         
         self.db.commit()
+        clear_category_cache()
+        # Cached product payloads carry the category name
+        invalidate_cache(*PRODUCT_CACHE_PREFIXES)
         return True
     
     # =============================================================================
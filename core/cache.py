@@ -0,0 +1,137 @@
+"""
+Redis-backed caching for read-heavy service methods.
+Caching is skipped when REDIS_URL is not configured or Redis is unreachable,
+so callers always fall back to computing the result.
+"""
+
+import hashlib
+import inspect
+from functools import wraps
+from typing import Any, Callable, Optional, Type
+
+import orjson
+import redis
+from pydantic import BaseModel
+
+from core.config import settings
+from core.exceptions import ConflictException
+
+_redis_client: Optional[redis.Redis] = None
+
+def get_redis() -> Optional[redis.Redis]:
+    """Get the shared Redis client, or None when caching is not configured"""
+    global _redis_client
+    if _redis_client is None and settings.REDIS_URL:
+        _redis_client = redis.Redis.from_url(settings.REDIS_URL)
+    return _redis_client
+
+def build_cache_key(prefix: str, *parts: Any) -> str:
+    """Build a cache key of the form `prefix:part1:part2`"""
+    return ":".join([prefix, *("-" if part is None else str(part) for part in parts)])
+
+def cached(prefix: str, ttl: int, response_model: Type[BaseModel]) -> Callable:
+    """
+    Cache a method's Pydantic response in Redis for `ttl` seconds.
+    The key is the prefix followed by the call arguments (excluding `self`).
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            client = get_redis()
+            if client is None:
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = build_cache_key(prefix, *(value for name, value in bound.arguments.items() if name != "self"))
+
+            try:
+                cached_value = client.get(key)
+            except redis.RedisError:
+                return func(*args, **kwargs)
+
+            if cached_value is not None:
+                return response_model.model_validate_json(cached_value)
+
+            result = func(*args, **kwargs)
+            try:
+                client.set(key, result.model_dump_json(), ex=ttl)
+            except redis.RedisError:
+                pass
+
+            return result
+
+        return wrapper
+    return decorator
+
+# Placeholder stored under an idempotency key while the first call is still running
+_IN_FLIGHT = b"__in_flight__"
+
+def idempotent(prefix: str, ttl: int, response_model: Type[BaseModel]) -> Callable:
+    """
+    Replay a method's Pydantic response for identical calls made within `ttl` seconds.
+    The key is the prefix followed by a hash of the call arguments (excluding `self`);
+    a duplicate that arrives while the first call is still running is rejected.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            client = get_redis()
+            if client is None:
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = {name: value for name, value in bound.arguments.items() if name != "self"}
+            digest = hashlib.blake2b(
+                orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str),
+                digest_size=16
+            ).hexdigest()
+            key = build_cache_key(prefix, digest)
+
+            try:
+                if not client.set(key, _IN_FLIGHT, nx=True, ex=ttl):
+                    stored = client.get(key)
+                    if stored == _IN_FLIGHT:
+                        raise ConflictException("An identical request is already being processed")
+                    if stored is not None:
+                        return response_model.model_validate_json(stored)
+            except redis.RedisError:
+                return func(*args, **kwargs)
+
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                try:
+                    client.delete(key)
+                except redis.RedisError:
+                    pass
+                raise
+
+            try:
+                client.set(key, result.model_dump_json(), ex=ttl)
+            except redis.RedisError:
+                pass
+
+            return result
+
+        return wrapper
+    return decorator
+
+def invalidate_cache(*prefixes: str) -> None:
+    """Delete every cached entry stored under the given key prefixes"""
+    client = get_redis()
+    if client is None:
+        return
+
+    try:
+        for prefix in prefixes:
+            keys = list(client.scan_iter(match=f"{prefix}:*"))
+            if keys:
+                client.delete(*keys)
+    except redis.RedisError:
+        pass
@@ -0,0 +1,33 @@
+"""
+Redis-backed fixed-window rate limiting.
+Limits are not enforced when REDIS_URL is not configured or Redis is unreachable.
+"""
+
+import redis
+
+from core.cache import build_cache_key, get_redis
+from core.exceptions import RateLimitException
+
+# Increment the window counter and start its expiry on the first hit, atomically
+_INCREMENT_WINDOW = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return count
+"""
+
+def enforce_rate_limit(prefix: str, identity: str, limit: int, window_seconds: int = 60) -> None:
+    """Raise RateLimitException once `identity` exceeds `limit` calls in the current window"""
+    client = get_redis()
+    if client is None:
+        return
+
+    key = build_cache_key(prefix, identity)
+    try:
+        count = client.eval(_INCREMENT_WINDOW, 1, key, window_seconds)
+    except redis.RedisError:
+        return
+
+    if count > limit:
+        raise RateLimitException(f"Too many requests, try again in {window_seconds} seconds")
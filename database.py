@@ -4,8 +4,9 @@ Handles SQLAlchemy engine setup, connection pooling, and session creation.
 """
 
 import os
-from typing import Generator
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from typing import Generator, Iterator
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
@@ -20,6 +21,7 @@ DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
 DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "30"))
 DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
 DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
 
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
@@ -33,6 +35,7 @@ engine = create_engine(
     pool_timeout=DB_POOL_TIMEOUT,
     pool_recycle=DB_POOL_RECYCLE,
     pool_pre_ping=True,  # Verify connections before use
+    query_cache_size=DB_QUERY_CACHE_SIZE,  # Compiled SQL cache; sized for the dynamic filter/sort shapes
     echo=False,  # Set to True for SQL query logging in development
 )
 
@@ -59,6 +62,21 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+@contextmanager
+def read_only_transaction(db: Session) -> Iterator[Session]:
+    """
+    Run a group of reads in one READ ONLY transaction.
+    If the session already has a transaction open, its mode cannot change and it is reused as is.
+    """
+    if db.in_transaction():
+        yield db
+        return
+    
+    with db.begin():
+        db.execute(text("SET TRANSACTION READ ONLY"))
+        yield db
+
+
 def create_tables():
     """Create all tables in the database."""
     Base.metadata.create_all(bind=engine)
@@ -15,6 +15,7 @@ from database import get_db, create_tables, check_database_connection, Base
 from core.config import settings
 from core.exceptions import LabanitaException
 from core.responses import success_response, error_response
+from schemas import build_response_models
 from auth.routes import router as auth_router
 from user.routes import router as user_router
 from categories.routes import router as category_router
@@ -36,6 +37,9 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting Labanita Backend...")
     
+    # Build the deferred response schemas before the first request needs them
+    build_response_models()
+    
     # Create database tables
     try:
         await create_tables()
@@ -296,16 +300,14 @@ async def get_products(
     Consider using the new product management endpoints for better functionality.
     """
     try:
+        from sqlalchemy.orm import selectinload
         from models import Product
-        from schemas import ProductResponse
+        from schemas import serialize_products
         
-        products = db.query(Product).offset(skip).limit(limit).all()
+        # ProductResponse includes the category, so load them all in one IN query
+        products = db.query(Product).options(selectinload(Product.category)).offset(skip).limit(limit).all()
         
-        product_responses = []
-        for product in products:
-            product_responses.append(ProductResponse.from_orm(product))
-        
-        return product_responses
+        return serialize_products(products)
         
     except Exception as e:
         raise HTTPException(
@@ -360,15 +362,11 @@ async def get_categories_legacy(
     """
     try:
         from models import Category
-        from schemas import CategoryResponse
+        from schemas import serialize_categories
         
         categories = db.query(Category).offset(skip).limit(limit).all()
         
-        category_responses = []
-        for category in categories:
-            category_responses.append(CategoryResponse.from_orm(category))
-        
-        return category_responses
+        return serialize_categories(categories)
         
     except Exception as e:
         raise HTTPException(
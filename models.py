@@ -8,9 +8,9 @@ from datetime import datetime
 from typing import List, Optional
 from sqlalchemy import (
     Column, String, Integer, Boolean, Text, Numeric, DateTime, 
-    ForeignKey, CheckConstraint, UniqueConstraint, Index
+    ForeignKey, CheckConstraint, UniqueConstraint, Index, Computed, text, DDL, event
 )
-from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP
+from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP, TSVECTOR
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -124,6 +124,7 @@ class Category(Base):
         Index("idx_categories_slug", "category_slug"),
         Index("idx_categories_active", "is_active"),
         Index("idx_categories_sort_order", "sort_order"),
+        Index("idx_categories_name_trgm", "category_name", postgresql_using="gin", postgresql_ops={"category_name": "gin_trgm_ops"}),
     )
 
 
@@ -141,6 +142,8 @@ class Product(Base):
         ForeignKey("categories.category_id", ondelete="RESTRICT"), 
         nullable=False
     )
+    # Copy of categories.category_name kept in sync by database triggers
+    category_name_cached: Mapped[Optional[str]] = mapped_column(String(255))
     product_name: Mapped[str] = mapped_column(String(255), nullable=False)
     product_slug: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     description: Mapped[Optional[str]] = mapped_column(Text)
@@ -186,6 +189,16 @@ class Product(Base):
         server_default=func.current_timestamp()
     )
     
+    search_vec: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', coalesce(product_name, '') || ' ' || coalesce(description, ''))",
+            persisted=True
+        ),
+        # Only used in WHERE and ORDER BY; never load it onto entities
+        deferred=True
+    )
+    
     # Relationships
     category: Mapped["Category"] = relationship("Category", back_populates="products")
     order_items: Mapped[List["OrderItem"]] = relationship("OrderItem", back_populates="product")
@@ -202,7 +215,60 @@ class Product(Base):
         Index("idx_products_best_selling", "is_best_selling"),
         Index("idx_products_active", "is_active"),
         Index("idx_products_price", "base_price"),
-    )
+        Index("idx_products_search_vec", "search_vec", postgresql_using="gin"),
+        Index("idx_products_category_name_trgm", "category_name_cached", postgresql_using="gin", postgresql_ops={"category_name_cached": "gin_trgm_ops"}),
+        Index("idx_products_category_active", "category_id", "is_active"),
+        Index("idx_products_category_active_sort", "category_id", "is_active", "sort_order", "product_name"),
+        Index("idx_products_featured_sort", "sort_order", "product_name", postgresql_where=text("is_featured AND is_active")),
+        Index("idx_products_best_selling_sort", "sort_order", "product_name", postgresql_where=text("is_best_selling AND is_active")),
+        Index("idx_products_new_arrival_created", "created_at", postgresql_where=text("is_new_arrival AND is_active")),
+    )
+
+
+# Triggers keeping products.category_name_cached in sync, installed alongside the table so
+# databases built with create_all match products_database_update.sql
+_CATEGORY_NAME_SYNC_DDL = (
+    DDL("""
+        CREATE OR REPLACE FUNCTION sync_product_category_name()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            SELECT category_name INTO NEW.category_name_cached
+            FROM categories
+            WHERE category_id = NEW.category_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """),
+    DDL("DROP TRIGGER IF EXISTS trigger_sync_product_category_name ON products"),
+    DDL("""
+        CREATE TRIGGER trigger_sync_product_category_name
+            BEFORE INSERT OR UPDATE OF category_id ON products
+            FOR EACH ROW EXECUTE FUNCTION sync_product_category_name()
+    """),
+    DDL("""
+        CREATE OR REPLACE FUNCTION propagate_category_name()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE products
+            SET category_name_cached = NEW.category_name
+            WHERE category_id = NEW.category_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """),
+    DDL("DROP TRIGGER IF EXISTS trigger_propagate_category_name ON categories"),
+    DDL("""
+        CREATE TRIGGER trigger_propagate_category_name
+            AFTER UPDATE OF category_name ON categories
+            FOR EACH ROW
+            WHEN (OLD.category_name IS DISTINCT FROM NEW.category_name)
+            EXECUTE FUNCTION propagate_category_name()
+    """),
+)
+
+for _ddl in _CATEGORY_NAME_SYNC_DDL:
+    # Categories are created before products, so both tables exist once products does
+    event.listen(Product.__table__, "after_create", _ddl.execute_if(dialect="postgresql"))
 
 
 class Address(Base):
@@ -479,6 +545,7 @@ class Order(Base):
         Index("idx_orders_user", "user_id"),
         Index("idx_orders_status", "order_status"),
         Index("idx_orders_created", "created_at"),
+        Index("idx_orders_status_created", "order_status", "created_at"),
         Index("idx_orders_number", "order_number"),
         Index("idx_orders_address", "address_id"),
         Index("idx_orders_payment_method", "payment_method_id"),
@@ -314,7 +314,7 @@ async def get_product_offers(
 
 @router.get("/search", response_model=ProductSearchResponse)
 async def search_products(
-    q: str = Query(..., min_length=2, description="Search query"),
+    q: str = Query(..., min_length=2, description="Search words, matched as whole words in product names and descriptions"),
     category_id: Optional[str] = Query(None, description="Limit search to specific category"),
     price_min: Optional[float] = Query(None, ge=0, description="Minimum price filter"),
     price_max: Optional[float] = Query(None, ge=0, description="Maximum price filter"),
@@ -327,7 +327,10 @@ async def search_products(
     """
     Search products by query with filters
     
-    Performs a comprehensive search across product names, descriptions, and tags.
+    Performs a full-text search across product names and descriptions.
+    Every word of the query must appear as a whole word (case-insensitive, no stemming);
+    parts of words are not matched, and tags are not searched (use /filter with tags instead).
+    Results are ordered by the requested sort, then by relevance.
     Supports additional filtering by category, price, stock, and rating.
     """
     try:
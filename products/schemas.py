@@ -1,7 +1,8 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, FrozenSet
 from datetime import datetime
+from functools import cached_property
 from decimal import Decimal
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, validator, model_validator
 from enum import Enum
 
 # =============================================================================
@@ -132,6 +133,9 @@ class ProductFilterResponse(BaseModel):
 # FILTER SCHEMAS
 # =============================================================================
 
+# Filters that only apply when truthy, so an empty string or list adds no predicate
+_TRUTHY_FILTER_FIELDS = frozenset({"category_id", "category_name", "tags", "allergens"})
+
 class ProductFilter(BaseModel):
     """Schema for product filtering"""
     category_id: Optional[str] = Field(None, description="Filter by category ID")
@@ -149,19 +153,28 @@ class ProductFilter(BaseModel):
     weight_min: Optional[float] = Field(None, ge=0, description="Minimum weight filter")
     weight_max: Optional[float] = Field(None, ge=0, description="Maximum weight filter")
     
-    @validator('price_max')
-    def validate_price_range(cls, v, values):
-        if v is not None and 'price_min' in values and values['price_min'] is not None:
-            if v < values['price_min']:
-                raise ValueError('Maximum price cannot be less than minimum price')
-        return v
+    @model_validator(mode='after')
+    def validate_ranges(self):
+        if self.price_max is not None and self.price_min is not None and self.price_max < self.price_min:
+            raise ValueError('Maximum price cannot be less than minimum price')
+        if self.weight_max is not None and self.weight_min is not None and self.weight_max < self.weight_min:
+            raise ValueError('Maximum weight cannot be less than minimum weight')
+        return self
+    
+    @cached_property
+    def mask(self) -> int:
+        """Bitmask of populated fields (bit i is the i-th declared field), used as a query-shape key"""
+        bits = 0
+        for i, name in enumerate(self.model_fields):
+            value = getattr(self, name)
+            if (value if name in _TRUTHY_FILTER_FIELDS else value is not None):
+                bits |= 1 << i
+        return bits
     
-    @validator('weight_max')
-    def validate_weight_range(cls, v, values):
-        if v is not None and 'weight_min' in values and values['weight_min'] is not None:
-            if v < values['weight_min']:
-                raise ValueError('Maximum weight cannot be less than minimum weight')
-        return v
+    @classmethod
+    def fields_for_mask(cls, mask: int) -> FrozenSet[str]:
+        """Field names whose bits are set in a mask produced by `mask`"""
+        return frozenset(name for i, name in enumerate(cls.model_fields) if mask & (1 << i))
 
 class ProductSearch(BaseModel):
     """Schema for product search"""
@@ -1,10 +1,18 @@
 import uuid
+import threading
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple, Callable
+import cachetools
+from cachetools.keys import hashkey
+from dateutil.relativedelta import relativedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, asc, and_, or_, text, case
+from sqlalchemy import func, desc, asc, and_, or_, text, case, bindparam, select, exists, union_all, literal, literal_column, any_, String
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import IntegrityError
 
+from core.cache import cached
+from database import read_only_transaction
 from core.exceptions import (
     NotFoundException, 
     ValidationException, 
@@ -19,6 +27,143 @@ from products.schemas import (
     ProductFilter, ProductSearch, PaginationParams
 )
 
+# Redis key prefixes of cached product reads, cleared whenever products are written
+PRODUCT_CACHE_PREFIXES = ("product_analytics", "featured_products", "new_arrivals")
+
+# Process-local cache for the search category filters, which change on a scale of minutes
+_filter_options_cache = cachetools.TTLCache(maxsize=4, ttl=300)
+_filter_options_lock = threading.Lock()
+
+def _filter_options_key(name: str) -> Callable:
+    """Cache key for a helper whose result depends on the database, not the service instance"""
+    return lambda self, *args, **kwargs: hashkey(name, *args, **kwargs)
+
+# Process-local cache for autocomplete suggestions, keyed by the normalised query
+_search_suggestions_cache = cachetools.TTLCache(maxsize=1024, ttl=60)
+_search_suggestions_lock = threading.Lock()
+
+# Queries shorter than this get no suggestions
+MIN_SUGGESTION_QUERY_LENGTH = 2
+
+# Static filter options offered alongside filtered product listings
+AVAILABLE_FILTER_OPTIONS = {
+    "price_ranges": (
+        {"label": "Under $10", "min": 0, "max": 10},
+        {"label": "$10 - $25", "min": 10, "max": 25},
+        {"label": "$25 - $50", "min": 25, "max": 50},
+        {"label": "$50 - $100", "min": 50, "max": 100},
+        {"label": "Over $100", "min": 100, "max": None}
+    ),
+    "rating_options": (
+        {"label": "4+ Stars", "value": 4.0},
+        {"label": "3+ Stars", "value": 3.0},
+        {"label": "2+ Stars", "value": 2.0}
+    ),
+    "stock_options": (
+        {"label": "In Stock", "value": True},
+        {"label": "Out of Stock", "value": False}
+    )
+}
+
+# Filter fields that pick a predicate instead of being bound as parameters
+_UNBOUND_FILTER_FIELDS = {"in_stock", "on_sale"}
+
+# Required ProductResponse fields; a NULL in any of them sends the response through full validation
+_REQUIRED_PRODUCT_FIELDS = tuple(name for name, field in ProductResponse.model_fields.items() if field.is_required())
+
+def _array_matches_all(column: Any, name: str) -> Any:
+    """
+    Predicate that every value bound as `name` matches an element of an array column with ILIKE '%value%'.
+    The values are bound as one array, so the SQL does not change with their count.
+    """
+    value = func.unnest(bindparam(name, type_=ARRAY(String))).column_valued("value")
+    element = func.unnest(column).column_valued("element")
+    matched = select(element).where(element.ilike(literal("%") + value + literal("%"))).exists()
+    return ~select(value).where(~matched).exists()
+
+@lru_cache(maxsize=256)
+def _product_filter_criteria(
+    mask: int,
+    in_stock: Optional[bool],
+    on_sale: Optional[bool]
+) -> Tuple[Any, ...]:
+    """
+    Build the WHERE criteria for one ProductFilter shape.
+    The SQL only depends on which fields are populated, so it is built once per mask
+    and the actual values are supplied as bind parameters at execution time.
+    """
+    populated = ProductFilter.fields_for_mask(mask)
+    criteria = [Product.is_active == True]
+    
+    if "category_id" in populated:
+        criteria.append(Product.category_id == bindparam("category_id"))
+    
+    if "category_name" in populated:
+        criteria.append(Product.category_name_cached.ilike(bindparam("category_name")))
+    
+    if "price_min" in populated:
+        criteria.append(Product.price >= bindparam("price_min"))
+    
+    if "price_max" in populated:
+        criteria.append(Product.price <= bindparam("price_max"))
+    
+    if in_stock is not None:
+        criteria.append(Product.stock_quantity > 0 if in_stock else Product.stock_quantity <= 0)
+    
+    if on_sale is not None:
+        criteria.append(Product.sale_price.isnot(None) if on_sale else Product.sale_price.is_(None))
+    
+    if "min_rating" in populated:
+        criteria.append(Product.rating >= bindparam("min_rating"))
+    
+    if "is_featured" in populated:
+        criteria.append(Product.is_featured == bindparam("is_featured"))
+    
+    if "is_new_arrival" in populated:
+        criteria.append(Product.is_new_arrival == bindparam("is_new_arrival"))
+    
+    if "is_best_selling" in populated:
+        criteria.append(Product.is_best_selling == bindparam("is_best_selling"))
+    
+    if "weight_min" in populated:
+        criteria.append(Product.weight >= bindparam("weight_min"))
+    
+    if "weight_max" in populated:
+        criteria.append(Product.weight <= bindparam("weight_max"))
+    
+    # Every requested tag or allergen must be a case-insensitive substring of some element
+    if "tags" in populated:
+        criteria.append(_array_matches_all(Product.tags, "tags"))
+    
+    if "allergens" in populated:
+        criteria.append(_array_matches_all(Product.allergens, "allergens"))
+    
+    return tuple(criteria)
+
+def _category_name_column() -> Any:
+    """The product's category name, read from categories only while category_name_cached is not yet filled"""
+    category_name = select(Category.category_name)\
+                        .where(Category.category_id == Product.category_id)\
+                        .scalar_subquery()
+    return func.coalesce(Product.category_name_cached, category_name).label("category_name")
+
+@lru_cache(maxsize=1)
+def _product_response_columns() -> Tuple[Any, ...]:
+    """Columns read by the product response builder, for list queries that skip ORM instantiation"""
+    return (
+        Product.product_id, Product.product_name, Product.description,
+        Product.price, Product.sale_price, Product.cost_price,
+        Product.sku, Product.barcode, Product.weight, Product.dimensions,
+        Product.image_url, Product.gallery_images,
+        Product.category_id, _category_name_column(),
+        Product.is_active, Product.is_featured, Product.is_new_arrival, Product.is_best_selling,
+        Product.stock_quantity, Product.min_stock_threshold, Product.max_stock_threshold,
+        Product.rating, Product.review_count, Product.sales_count, Product.view_count,
+        Product.tags, Product.allergens, Product.nutritional_info, Product.ingredients,
+        Product.storage_instructions, Product.expiry_date,
+        Product.created_at, Product.updated_at
+    )
+
 class ProductService:
     """Product service for product management, search, and analytics"""
     
@@ -42,7 +187,7 @@ class ProductService:
         sort_order: str = "desc"
     ) -> ProductListResponse:
         """Get all products with optional filtering and sorting"""
-        query = self.db.query(Product).join(Category, Product.category_id == Category.category_id)
+        query = self.db.query(*_product_response_columns())
         
         # Apply filters
         if category_id is not None:
@@ -71,36 +216,34 @@ class ProductService:
             # Default sorting
             query = query.order_by(desc(Product.created_at))
         
-        # Get total count before pagination
-        total_count = query.count()
-        
-        # Apply pagination
-        products = query.offset(skip).limit(limit).all()
+        # Get the page and the total count in one round-trip
+        products, total_count = self._fetch_page(query, skip, limit)
         
         # Convert to response format
         product_responses = []
         for product in products:
-            product_responses.append(self._build_product_response(product))
+            product_responses.append(self._build_product_response_from_row(product))
         
-        # Count different types
-        active_count = self.db.query(Product).filter(Product.is_active == True).count()
-        featured_count = self.db.query(Product).filter(Product.is_featured == True).count()
-        new_arrivals_count = self.db.query(Product).filter(Product.is_new_arrival == True).count()
-        best_selling_count = self.db.query(Product).filter(Product.is_best_selling == True).count()
+        # Count different types in a single scan using COUNT(*) FILTER (WHERE ...)
+        counts = self.db.query(
+            func.count().filter(Product.is_active == True).label('active'),
+            func.count().filter(Product.is_featured == True).label('featured'),
+            func.count().filter(Product.is_new_arrival == True).label('new_arrivals'),
+            func.count().filter(Product.is_best_selling == True).label('best_selling')
+        ).one()
         
         return ProductListResponse(
             products=product_responses,
             total_count=total_count,
-            active_count=active_count,
-            featured_count=featured_count,
-            new_arrivals_count=new_arrivals_count,
-            best_selling_count=best_selling_count
+            active_count=counts.active,
+            featured_count=counts.featured,
+            new_arrivals_count=counts.new_arrivals,
+            best_selling_count=counts.best_selling
         )
     
     def get_product_by_id(self, product_id: str) -> ProductResponse:
         """Get a specific product by ID"""
-        product = self.db.query(Product).join(Category, Product.category_id == Category.category_id)\
-                         .filter(Product.product_id == product_id).first()
+        product = self.db.query(Product).filter(Product.product_id == product_id).first()
         
         if not product:
             raise NotFoundException(f"Product with ID {product_id} not found")
@@ -109,65 +252,65 @@ class ProductService:
     
     def get_product_detail(self, product_id: str) -> ProductDetailResponse:
         """Get detailed product information with related data"""
-        product = self.db.query(Product).join(Category, Product.category_id == Category.category_id)\
-                         .filter(Product.product_id == product_id).first()
-        
-        if not product:
-            raise NotFoundException(f"Product with ID {product_id} not found")
-        
-        # Build product response
-        product_response = self._build_product_response(product)
-        
-        # Get related products (same category, different products)
-        related_products = self.db.query(Product).join(Category, Product.category_id == Category.category_id)\
-                                  .filter(
-                                      and_(
-                                          Product.category_id == product.category_id,
-                                          Product.product_id != product_id,
-                                          Product.is_active == True
-                                      )
-                                  ).limit(6).all()
-        
-        related_responses = [self._build_product_response(p) for p in related_products]
-        
-        # Build category path
-        category_path = self._build_category_path(product.category_id)
-        
-        # Determine stock status
-        stock_status = self._determine_stock_status(product.stock_quantity, product.min_stock_threshold)
-        
-        # Calculate discount percentage
-        discount_percentage = None
-        if product.sale_price and product.price:
-            discount_percentage = ((product.price - product.sale_price) / product.price) * 100
-        
-        # Check if low stock
-        is_low_stock = product.stock_quantity <= product.min_stock_threshold
-        
-        # Estimate delivery time
-        estimated_delivery = self._estimate_delivery_time(product.stock_quantity)
-        
-        return ProductDetailResponse(
-            product=product_response,
-            related_products=related_responses,
-            category_path=category_path,
-            stock_status=stock_status,
-            discount_percentage=discount_percentage,
-            is_low_stock=is_low_stock,
-            estimated_delivery=estimated_delivery
-        )
+        with read_only_transaction(self.db):
+            # Fetch the product and up to 6 related products from its category in one query;
+            # the product itself sorts first, so an empty result means it does not exist
+            category_id = select(Product.category_id).where(Product.product_id == product_id).scalar_subquery()
+            products = self.db.execute(
+                select(Product).where(
+                    Product.category_id == category_id,
+                    or_(Product.product_id == product_id, Product.is_active == True)
+                ).order_by(desc(Product.product_id == product_id)).limit(7)
+            ).scalars().all()
+            
+            if not products:
+                raise NotFoundException(f"Product with ID {product_id} not found")
+            
+            product, related_products = products[0], products[1:]
+            
+            # Build product response
+            product_response = self._build_product_response(product)
+            related_responses = [self._build_product_response(p) for p in related_products]
+            
+            # Build category path
+            category_path = self._build_category_path(product.category_id)
+            
+            # Determine stock status
+            stock_status = self._determine_stock_status(product.stock_quantity, product.min_stock_threshold)
+            
+            # Calculate discount percentage
+            discount_percentage = None
+            if product.sale_price and product.price:
+                discount_percentage = ((product.price - product.sale_price) / product.price) * 100
+            
+            # Check if low stock
+            is_low_stock = product.stock_quantity <= product.min_stock_threshold
+            
+            # Estimate delivery time
+            estimated_delivery = self._estimate_delivery_time(product.stock_quantity)
+            
+            return ProductDetailResponse(
+                product=product_response,
+                related_products=related_responses,
+                category_path=category_path,
+                stock_status=stock_status,
+                discount_percentage=discount_percentage,
+                is_low_stock=is_low_stock,
+                estimated_delivery=estimated_delivery
+            )
     
     # =============================================================================
     # FEATURED PRODUCTS
     # =============================================================================
     
+    @cached("featured_products", ttl=120, response_model=FeaturedProductsResponse)
     def get_featured_products(
         self,
         limit: int = 20,
         category_id: Optional[str] = None
     ) -> FeaturedProductsResponse:
         """Get featured products"""
-        query = self.db.query(Product).join(Category, Product.category_id == Category.category_id)\
+        query = self.db.query(*_product_response_columns())\
                        .filter(Product.is_featured == True, Product.is_active == True)
         
         if category_id:
@@ -176,12 +319,12 @@ class ProductService:
         # Order by featured priority (you might want to add a featured_order field)
         products = query.order_by(desc(Product.rating), desc(Product.sales_count)).limit(limit).all()
         
-        product_responses = [self._build_product_response(p) for p in products]
+        product_responses = [self._build_product_response_from_row(p) for p in products]
         
-        # Get category breakdown
+        # Break the returned products down by category, so the counts agree with total_count
         category_breakdown = {}
         for product in products:
-            cat_name = product.category.category_name
+            cat_name = product.category_name or "Unknown"
             category_breakdown[cat_name] = category_breakdown.get(cat_name, 0) + 1
         
         return FeaturedProductsResponse(
@@ -194,6 +337,7 @@ class ProductService:
     # NEW ARRIVALS
     # =============================================================================
     
+    @cached("new_arrivals", ttl=120, response_model=NewArrivalsResponse)
     def get_new_arrivals(
         self,
         limit: int = 20,
@@ -202,7 +346,7 @@ class ProductService:
         """Get new arrival products"""
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
-        products = self.db.query(Product).join(Category, Product.category_id == Category.category_id)\
+        products = self.db.query(*_product_response_columns())\
                          .filter(
                              and_(
                                  Product.is_new_arrival == True,
@@ -211,7 +355,7 @@ class ProductService:
                              )
                          ).order_by(desc(Product.created_at)).limit(limit).all()
         
-        product_responses = [self._build_product_response(p) for p in products]
+        product_responses = [self._build_product_response_from_row(p) for p in products]
         
         arrival_period = f"Last {days} days"
         
@@ -231,10 +375,9 @@ class ProductService:
         days: int = 90
     ) -> BestSellingProductsResponse:
         """Get best selling products based on sales data"""
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
-        
-        # Get products with sales in the specified period
-        products = self.db.query(Product).join(Category, Product.category_id == Category.category_id)\
+        # Revenue is computed alongside the product columns in the same query
+        revenue = func.coalesce(Product.sales_count * Product.price, 0).label('revenue')
+        products = self.db.query(*_product_response_columns(), revenue)\
                          .filter(
                              and_(
                                  Product.is_best_selling == True,
@@ -242,7 +385,7 @@ class ProductService:
                              )
                          ).order_by(desc(Product.sales_count)).limit(limit).all()
         
-        product_responses = [self._build_product_response(p) for p in products]
+        product_responses = [self._build_product_response_from_row(p) for p in products]
         
         sales_period = f"Last {days} days"
         
@@ -254,7 +397,7 @@ class ProductService:
                 "product_id": str(product.product_id),
                 "product_name": product.product_name,
                 "sales_count": product.sales_count,
-                "total_revenue": float(product.sales_count * product.price) if product.sales_count else 0
+                "total_revenue": float(product.revenue)
             })
         
         return BestSellingProductsResponse(
@@ -273,18 +416,12 @@ class ProductService:
         search_query: ProductSearch
     ) -> ProductSearchResponse:
         """Search products by query with filters"""
-        query = self.db.query(Product).join(Category, Product.category_id == Category.category_id)\
+        query = self.db.query(*_product_response_columns())\
                        .filter(Product.is_active == True)
         
-        # Apply search query
-        search_filter = f"%{search_query.query}%"
-        query = query.filter(
-            or_(
-                Product.product_name.ilike(search_filter),
-                Product.description.ilike(search_filter),
-                Product.tags.any(lambda tag: tag.ilike(search_filter)) if Product.tags else False
-            )
-        )
+        # Apply search query against the GIN-indexed full-text vector
+        ts_query = func.plainto_tsquery("simple", search_query.query)
+        query = query.filter(Product.search_vec.op("@@")(ts_query))
         
         # Apply additional filters
         if search_query.category_id:
@@ -313,13 +450,13 @@ class ProductService:
             else:
                 query = query.order_by(asc(sort_column))
         
-        # Get total count
-        total_count = query.count()
+        # Break ties by relevance
+        query = query.order_by(desc(func.ts_rank(Product.search_vec, ts_query)))
         
-        # Get products
-        products = query.limit(100).all()  # Limit search results
+        # Get products and total count
+        products, total_count = self._fetch_page(query, 0, 100)  # Limit search results
         
-        product_responses = [self._build_product_response(p) for p in products]
+        product_responses = [self._build_product_response_from_row(p) for p in products]
         
         # Generate search suggestions
         search_suggestions = self._generate_search_suggestions(search_query.query)
@@ -327,8 +464,8 @@ class ProductService:
         # Get category filters
         category_filters = self._get_category_filters_for_search()
         
-        # Calculate price range
-        price_range = self._calculate_price_range(products)
+        # Calculate price range over all matches, not just the returned page
+        price_range = self._calculate_price_range(query)
         
         return ProductSearchResponse(
             products=product_responses,
@@ -349,67 +486,19 @@ class ProductService:
         pagination: PaginationParams
     ) -> ProductFilterResponse:
         """Filter products based on multiple criteria"""
-        query = self.db.query(Product).join(Category, Product.category_id == Category.category_id)\
-                       .filter(Product.is_active == True)
-        
-        # Apply filters
-        if filters.category_id:
-            query = query.filter(Product.category_id == filters.category_id)
+        # Criteria are cached per populated-field shape; values are bound below
+        criteria = _product_filter_criteria(filters.mask, filters.in_stock, filters.on_sale)
+        params = filters.dict(exclude_none=True, exclude=_UNBOUND_FILTER_FIELDS)
+        if "category_name" in params:
+            params["category_name"] = f"%{params['category_name']}%"
         
-        if filters.category_name:
-            query = query.filter(Category.category_name.ilike(f"%{filters.category_name}%"))
+        query = self.db.query(*_product_response_columns())\
+                       .filter(*criteria).params(**params)
         
-        if filters.price_min is not None:
-            query = query.filter(Product.price >= filters.price_min)
+        # Apply pagination and get total count
+        products, total_count = self._fetch_page(query, pagination.offset, pagination.size)
         
-        if filters.price_max is not None:
-            query = query.filter(Product.price <= filters.price_max)
-        
-        if filters.in_stock is not None:
-            if filters.in_stock:
-                query = query.filter(Product.stock_quantity > 0)
-            else:
-                query = query.filter(Product.stock_quantity <= 0)
-        
-        if filters.on_sale is not None:
-            if filters.on_sale:
-                query = query.filter(Product.sale_price.isnot(None))
-            else:
-                query = query.filter(Product.sale_price.is_(None))
-        
-        if filters.min_rating is not None:
-            query = query.filter(Product.rating >= filters.min_rating)
-        
-        if filters.is_featured is not None:
-            query = query.filter(Product.is_featured == filters.is_featured)
-        
-        if filters.is_new_arrival is not None:
-            query = query.filter(Product.is_new_arrival == filters.is_new_arrival)
-        
-        if filters.is_best_selling is not None:
-            query = query.filter(Product.is_best_selling == filters.is_best_selling)
-        
-        if filters.tags:
-            for tag in filters.tags:
-                query = query.filter(Product.tags.any(lambda t: t.ilike(f"%{tag}%")))
-        
-        if filters.allergens:
-            for allergen in filters.allergens:
-                query = query.filter(Product.allergens.any(lambda a: a.ilike(f"%{allergen}%")))
-        
-        if filters.weight_min is not None:
-            query = query.filter(Product.weight >= filters.weight_min)
-        
-        if filters.weight_max is not None:
-            query = query.filter(Product.weight <= filters.weight_max)
-        
-        # Get total count
-        total_count = query.count()
-        
-        # Apply pagination
-        products = query.offset(pagination.offset).limit(pagination.size).all()
-        
-        product_responses = [self._build_product_response(p) for p in products]
+        product_responses = [self._build_product_response_from_row(p) for p in products]
         
         # Build applied filters
         applied_filters = filters.dict(exclude_none=True)
@@ -421,9 +510,7 @@ class ProductService:
         filter_summary = {
             "total_products": total_count,
             "filtered_products": len(products),
-            "categories_found": len(set(p.category_id for p in products)),
-            "price_range": self._calculate_price_range(products),
-            "rating_distribution": self._calculate_rating_distribution(products)
+            **self._summarize_filter_results(query)
         }
         
         return ProductFilterResponse(
@@ -447,7 +534,7 @@ class ProductService:
         sort_order: str = "desc"
     ) -> PaginatedProductsResponse:
         """Get paginated products with optional filtering"""
-        query = self.db.query(Product).join(Category, Product.category_id == Category.category_id)
+        query = self.db.query(*_product_response_columns())
         
         # Apply filters
         if category_id:
@@ -464,19 +551,16 @@ class ProductService:
             else:
                 query = query.order_by(asc(sort_column))
         
-        # Get total count
-        total = query.count()
+        # Get products for current page and total count
+        products, total = self._fetch_page(query, pagination.offset, pagination.size)
         
         # Calculate pagination
         pages = (total + pagination.size - 1) // pagination.size
         has_next = pagination.page < pages
         has_prev = pagination.page > 1
         
-        # Get products for current page
-        products = query.offset(pagination.offset).limit(pagination.size).all()
-        
         # Convert to response format
-        product_responses = [self._build_product_response(p) for p in products]
+        product_responses = [self._build_product_response_from_row(p) for p in products]
         
         return PaginatedProductsResponse(
             products=product_responses,
@@ -494,7 +578,10 @@ class ProductService:
     
     def get_product_statistics(self, product_id: str) -> ProductStatsResponse:
         """Get comprehensive statistics for a product"""
-        product = self.db.query(Product).filter(Product.product_id == product_id).first()
+        product = self.db.query(
+            Product.product_id, Product.product_name, Product.view_count,
+            Product.stock_quantity, Product.price, Product.cost_price
+        ).filter(Product.product_id == product_id).first()
         if not product:
             raise NotFoundException(f"Product with ID {product_id} not found")
         
@@ -529,13 +616,11 @@ class ProductService:
             profit_margin = ((product.price - product.cost_price) / product.price) * 100
         
         # Get last sale date
-        last_sale = self.db.query(OrderItem).join(Order, OrderItem.order_id == Order.order_id)\
-                           .filter(
-                               OrderItem.product_id == product_id,
-                               Order.status == 'completed'
-                           ).order_by(desc(Order.created_at)).first()
-        
-        last_sale_date = last_sale.order.created_at if last_sale else None
+        last_sale_date = self.db.query(Order.created_at).join(OrderItem, OrderItem.order_id == Order.order_id)\
+                                .filter(
+                                    OrderItem.product_id == product_id,
+                                    Order.status == 'completed'
+                                ).order_by(desc(Order.created_at)).limit(1).scalar()
         
         # Get sales trend (last 12 months)
         sales_trend = self._get_sales_trend(product_id)
@@ -554,54 +639,53 @@ class ProductService:
             sales_trend=sales_trend
         )
     
+    @cached("product_analytics", ttl=60, response_model=ProductAnalyticsResponse)
     def get_product_analytics(self) -> ProductAnalyticsResponse:
         """Get overall product analytics"""
-        # Get basic counts
-        total_products = self.db.query(Product).count()
-        active_products = self.db.query(Product).filter(Product.is_active == True).count()
-        out_of_stock_products = self.db.query(Product).filter(Product.stock_quantity <= 0).count()
-        low_stock_products = self.db.query(Product).filter(
-            and_(
-                Product.stock_quantity > 0,
-                Product.stock_quantity <= Product.min_stock_threshold
+        with read_only_transaction(self.db):
+            # Get counts, stock value and averages in a single scan
+            stats = self.db.query(
+                func.count().label('total'),
+                func.count().filter(Product.is_active == True).label('active'),
+                func.count().filter(Product.stock_quantity <= 0).label('out_of_stock'),
+                func.count().filter(
+                    and_(
+                        Product.stock_quantity > 0,
+                        Product.stock_quantity <= Product.min_stock_threshold
+                    )
+                ).label('low_stock'),
+                func.count().filter(Product.is_featured == True).label('featured'),
+                func.count().filter(Product.is_new_arrival == True).label('new_arrivals'),
+                func.count().filter(Product.is_best_selling == True).label('best_selling'),
+                func.sum(Product.stock_quantity * Product.price).label('stock_value'),
+                func.avg(Product.price).label('avg_price'),
+                func.avg(Product.rating).label('avg_rating')
+            ).one()
+            
+            total_stock_value = float(stats.stock_value) if stats.stock_value else 0.0
+            average_price = float(stats.avg_price) if stats.avg_price else 0.0
+            average_rating = float(stats.avg_rating) if stats.avg_rating else None
+            
+            # Get top categories
+            top_categories = self._get_top_categories()
+            
+            # Get sales performance
+            sales_performance = self._get_sales_performance()
+            
+            return ProductAnalyticsResponse(
+                total_products=stats.total,
+                active_products=stats.active,
+                out_of_stock_products=stats.out_of_stock,
+                low_stock_products=stats.low_stock,
+                featured_products=stats.featured,
+                new_arrivals=stats.new_arrivals,
+                best_selling_products=stats.best_selling,
+                total_stock_value=total_stock_value,
+                average_price=average_price,
+                average_rating=average_rating,
+                top_categories=top_categories,
+                sales_performance=sales_performance
             )
-        ).count()
-        featured_products = self.db.query(Product).filter(Product.is_featured == True).count()
-        new_arrivals = self.db.query(Product).filter(Product.is_new_arrival == True).count()
-        best_selling_products = self.db.query(Product).filter(Product.is_best_selling == True).count()
-        
-        # Calculate total stock value
-        stock_value_query = self.db.query(func.sum(Product.stock_quantity * Product.price)).scalar()
-        total_stock_value = float(stock_value_query) if stock_value_query else 0.0
-        
-        # Calculate average price
-        avg_price_query = self.db.query(func.avg(Product.price)).scalar()
-        average_price = float(avg_price_query) if avg_price_query else 0.0
-        
-        # Calculate average rating
-        avg_rating_query = self.db.query(func.avg(Product.rating)).filter(Product.rating.isnot(None)).scalar()
-        average_rating = float(avg_rating_query) if avg_rating_query else None
-        
-        # Get top categories
-        top_categories = self._get_top_categories()
-        
-        # Get sales performance
-        sales_performance = self._get_sales_performance()
-        
-        return ProductAnalyticsResponse(
-            total_products=total_products,
-            active_products=active_products,
-            out_of_stock_products=out_of_stock_products,
-            low_stock_products=low_stock_products,
-            featured_products=featured_products,
-            new_arrivals=new_arrivals,
-            best_selling_products=best_selling_products,
-            total_stock_value=total_stock_value,
-            average_price=average_price,
-            average_rating=average_rating,
-            top_categories=top_categories,
-            sales_performance=sales_performance
-        )
     
     # =============================================================================
     # RELATED PRODUCTS
@@ -613,12 +697,12 @@ class ProductService:
         limit: int = 6
     ) -> RelatedProductsResponse:
         """Get related products based on category and tags"""
-        product = self.db.query(Product).filter(Product.product_id == product_id).first()
+        product = self.db.query(Product.category_id, Product.tags).filter(Product.product_id == product_id).first()
         if not product:
             raise NotFoundException(f"Product with ID {product_id} not found")
         
         # Get products from same category
-        related_products = self.db.query(Product).join(Category, Product.category_id == Category.category_id)\
+        related_products = self.db.query(*_product_response_columns())\
                                   .filter(
                                       and_(
                                           Product.category_id == product.category_id,
@@ -627,20 +711,26 @@ class ProductService:
                                       )
                                   ).limit(limit).all()
         
-        # If not enough products from same category, add products with similar tags
+        # If not enough products from same category, add the products sharing the most tags
         if len(related_products) < limit and product.tags:
             remaining_limit = limit - len(related_products)
-            tag_products = self.db.query(Product).filter(
-                and_(
-                    Product.product_id != product_id,
-                    Product.is_active == True,
-                    Product.tags.any(lambda tag: tag.in_(product.tags))
-                )
-            ).limit(remaining_limit).all()
+            tags = bindparam("tags", product.tags, type_=ARRAY(String))
+            tag = func.unnest(Product.tags).column_valued("tag")
+            shared_tags = select(func.count()).where(tag == any_(tags)).scalar_subquery()
+            
+            tag_products = self.db.query(*_product_response_columns())\
+                              .filter(
+                                  and_(
+                                      Product.product_id != product_id,
+                                      Product.category_id != product.category_id,
+                                      Product.is_active == True,
+                                      Product.tags.op("&&")(tags)
+                                  )
+                              ).order_by(desc(shared_tags)).limit(remaining_limit).all()
             
             related_products.extend(tag_products)
         
-        product_responses = [self._build_product_response(p) for p in related_products]
+        product_responses = [self._build_product_response_from_row(p) for p in related_products]
         
         # Get categories of related products
         categories = list(set(p.category_name for p in related_products))
@@ -659,7 +749,16 @@ class ProductService:
     
     def _build_product_response(self, product: Product) -> ProductResponse:
         """Build product response from database model"""
-        return ProductResponse(
+        category_name = product.category_name_cached
+        if category_name is None:
+            # Not backfilled yet; read the name through the relationship
+            category_name = product.category.category_name
+        
+        return self._product_response_from_values(product, category_name)
+    
+    def _product_response_from_values(self, product: Any, category_name: Optional[str]) -> ProductResponse:
+        """Build product response from a model or a row selected with _product_response_columns()"""
+        data = dict(
             product_id=str(product.product_id),
             product_name=product.product_name,
             description=product.description,
@@ -673,7 +772,7 @@ class ProductService:
             image_url=product.image_url,
             gallery_images=product.gallery_images,
             category_id=str(product.category_id),
-            category_name=product.category.category_name,
+            category_name=category_name,
             is_active=product.is_active,
             is_featured=product.is_featured,
             is_new_arrival=product.is_new_arrival,
@@ -694,26 +793,53 @@ class ProductService:
             created_at=product.created_at,
             updated_at=product.updated_at
         )
+        
+        # Values are converted above, so skip per-field validation unless a required value is missing
+        if any(data[field] is None for field in _REQUIRED_PRODUCT_FIELDS):
+            return ProductResponse.model_validate(data)
+        return ProductResponse.model_construct(**data)
+    
+    def _fetch_page(self, query, offset: int, limit: int) -> Tuple[List[Any], int]:
+        """Fetch a page of product rows with the total match count from a COUNT(*) OVER () column"""
+        rows = query.add_columns(func.count().over().label('total_count'))\
+                    .offset(offset).limit(limit).all()
+        
+        if not rows:
+            # The window count is only available on returned rows; past the last page fall back
+            return [], query.count() if offset else 0
+        
+        return rows, rows[0].total_count
+    
+    def _build_product_response_from_row(self, row: Any) -> ProductResponse:
+        """Build product response from a row selected with _product_response_columns()"""
+        return self._product_response_from_values(row, row.category_name)
     
     def _build_category_path(self, category_id: str) -> List[Dict[str, str]]:
         """Build category navigation path"""
-        path = []
-        current_category = self.db.query(Category).filter(Category.category_id == category_id).first()
+        # Walk up the ancestry in one recursive query instead of one SELECT per level
+        ancestry = select(
+            Category.category_id, Category.parent_category_id, Category.category_name,
+            literal_column("0").label("depth")
+        ).where(Category.category_id == category_id).cte(name="category_path", recursive=True)
+        
+        ancestry = ancestry.union_all(
+            select(
+                Category.category_id, Category.parent_category_id, Category.category_name,
+                ancestry.c.depth + 1
+            ).join(ancestry, Category.category_id == ancestry.c.parent_category_id)
+        )
         
-        while current_category:
-            path.insert(0, {
-                "category_id": str(current_category.category_id),
-                "category_name": current_category.category_name
-            })
-            
-            if current_category.parent_category_id:
-                current_category = self.db.query(Category).filter(
-                    Category.category_id == current_category.parent_category_id
-                ).first()
-            else:
-                break
+        rows = self.db.execute(
+            select(ancestry.c.category_id, ancestry.c.category_name).order_by(desc(ancestry.c.depth))
+        ).all()
         
-        return path
+        return [
+            {
+                "category_id": str(row.category_id),
+                "category_name": row.category_name
+            }
+            for row in rows
+        ]
     
     def _determine_stock_status(self, stock_quantity: int, min_threshold: int) -> str:
         """Determine stock status based on quantity and threshold"""
@@ -733,154 +859,145 @@ class ProductService:
         else:
             return "Same day delivery"
     
+    @cachetools.cached(
+        _search_suggestions_cache,
+        key=lambda self, query: hashkey(query.strip().lower()),
+        lock=_search_suggestions_lock
+    )
     def _generate_search_suggestions(self, query: str) -> List[str]:
         """Generate search suggestions based on query"""
-        # This is a simple implementation - you might want to use more sophisticated algorithms
-        suggestions = []
-        
-        # Add category suggestions
-        categories = self.db.query(Category.category_name).filter(
-            Category.category_name.ilike(f"%{query}%")
-        ).limit(3).all()
-        
-        for cat in categories:
-            suggestions.append(f"Category: {cat.category_name}")
-        
-        # Add tag suggestions
-        products_with_tags = self.db.query(Product.tags).filter(
-            Product.tags.isnot(None),
-            Product.is_active == True
-        ).limit(5).all()
-        
-        for product_tags in products_with_tags:
-            if product_tags.tags:
-                for tag in product_tags.tags:
-                    if query.lower() in tag.lower() and tag not in suggestions:
-                        suggestions.append(f"Tag: {tag}")
-                        if len(suggestions) >= 5:
-                            break
-        
-        return suggestions[:5]
-    
-    def _get_category_filters_for_search(self) -> List[Dict[str, Any]]:
-        """Get available category filters for search"""
-        categories = self.db.query(Category).filter(Category.is_active == True).all()
-        
-        filters = []
-        for cat in categories:
-            product_count = self.db.query(Product).filter(
-                Product.category_id == cat.category_id,
-                Product.is_active == True
-            ).count()
+        query = query.strip()
+        if len(query) < MIN_SUGGESTION_QUERY_LENGTH:
+            return []
+        
+        pattern = f"%{query}%"
+        
+        # Up to 3 matching category names, followed by distinct matching tags from any active product
+        category_suggestions = select(
+            literal_column("1").label("source"),
+            (literal("Category: ") + Category.category_name).label("suggestion")
+        ).where(Category.category_name.ilike(pattern)).limit(3)
+        
+        tag = func.unnest(Product.tags).column_valued("tag")
+        tag_suggestions = select(
+            literal_column("2").label("source"),
+            (literal("Tag: ") + tag).label("suggestion")
+        ).select_from(Product).where(Product.is_active == True, tag.ilike(pattern)).distinct().limit(5)
+        
+        suggestions = union_all(category_suggestions, tag_suggestions).subquery()
+        rows = self.db.execute(
+            select(suggestions.c.suggestion).order_by(suggestions.c.source).limit(5)
+        ).scalars().all()
+        
+        return list(rows)
+    
+    @cachetools.cached(_filter_options_cache, key=_filter_options_key("category_filters"), lock=_filter_options_lock)
+    def _get_category_filters_for_search(self, include_counts: bool = True) -> List[Dict[str, Any]]:
+        """Get available category filters for search, optionally with their active product counts"""
+        if not include_counts:
+            # Only categories with at least one active product; EXISTS stops at the first match
+            categories = self.db.query(Category.category_id, Category.category_name)\
+                .filter(
+                    Category.is_active == True,
+                    exists().where(and_(Product.category_id == Category.category_id, Product.is_active == True))
+                ).all()
             
-            if product_count > 0:
-                filters.append({
-                    "category_id": str(cat.category_id),
-                    "category_name": cat.category_name,
-                    "product_count": product_count
-                })
+            return [
+                {"category_id": str(cat.category_id), "category_name": cat.category_name}
+                for cat in categories
+            ]
         
-        return filters
-    
-    def _calculate_price_range(self, products: List[Product]) -> Dict[str, float]:
-        """Calculate price range from products"""
-        if not products:
-            return {"min": 0.0, "max": 0.0}
+        # Count active products per category in one query; the inner join drops empty categories
+        categories = self.db.query(
+            Category.category_id,
+            Category.category_name,
+            func.count(Product.product_id).label('product_count')
+        ).join(Product, and_(Product.category_id == Category.category_id, Product.is_active == True))\
+         .filter(Category.is_active == True)\
+         .group_by(Category.category_id, Category.category_name)\
+         .all()
         
-        prices = [float(p.price) for p in products if p.price]
-        if not prices:
-            return {"min": 0.0, "max": 0.0}
+        return [
+            {
+                "category_id": str(cat.category_id),
+                "category_name": cat.category_name,
+                "product_count": cat.product_count
+            }
+            for cat in categories
+        ]
+    
+    def _calculate_price_range(self, query) -> Dict[str, float]:
+        """Calculate price range over every product matched by a query"""
+        min_price, max_price = query.with_entities(
+            func.min(Product.price), func.max(Product.price)
+        ).order_by(None).one()
         
         return {
-            "min": min(prices),
-            "max": max(prices)
+            "min": float(min_price or 0),
+            "max": float(max_price or 0)
         }
     
     def _get_available_filter_options(self) -> Dict[str, Any]:
         """Get available filter options for products"""
-        # Price ranges
-        price_ranges = [
-            {"label": "Under $10", "min": 0, "max": 10},
-            {"label": "$10 - $25", "min": 10, "max": 25},
-            {"label": "$25 - $50", "min": 25, "max": 50},
-            {"label": "$50 - $100", "min": 50, "max": 100},
-            {"label": "Over $100", "min": 100, "max": None}
-        ]
-        
-        # Rating options
-        rating_options = [
-            {"label": "4+ Stars", "value": 4.0},
-            {"label": "3+ Stars", "value": 3.0},
-            {"label": "2+ Stars", "value": 2.0}
-        ]
-        
-        # Stock options
-        stock_options = [
-            {"label": "In Stock", "value": True},
-            {"label": "Out of Stock", "value": False}
-        ]
-        
-        return {
-            "price_ranges": price_ranges,
-            "rating_options": rating_options,
-            "stock_options": stock_options
-        }
+        return AVAILABLE_FILTER_OPTIONS
     
-    def _calculate_rating_distribution(self, products: List[Product]) -> Dict[str, int]:
-        """Calculate rating distribution for products"""
-        distribution = {
-            "5_stars": 0,
-            "4_stars": 0,
-            "3_stars": 0,
-            "2_stars": 0,
-            "1_star": 0,
-            "no_rating": 0
+    def _summarize_filter_results(self, query) -> Dict[str, Any]:
+        """Calculate category count, price range and rating distribution over every matched product in one scan"""
+        rating_buckets = {
+            "5_stars": Product.rating >= 4.5,
+            "4_stars": and_(Product.rating >= 3.5, Product.rating < 4.5),
+            "3_stars": and_(Product.rating >= 2.5, Product.rating < 3.5),
+            "2_stars": and_(Product.rating >= 1.5, Product.rating < 2.5),
+            "1_star": Product.rating < 1.5,
+            "no_rating": Product.rating.is_(None)
         }
         
-        for product in products:
-            if product.rating is None:
-                distribution["no_rating"] += 1
-            elif product.rating >= 4.5:
-                distribution["5_stars"] += 1
-            elif product.rating >= 3.5:
-                distribution["4_stars"] += 1
-            elif product.rating >= 2.5:
-                distribution["3_stars"] += 1
-            elif product.rating >= 1.5:
-                distribution["2_stars"] += 1
-            else:
-                distribution["1_star"] += 1
+        categories_found, min_price, max_price, *bucket_counts = query.with_entities(
+            func.count(func.distinct(Product.category_id)),
+            func.min(Product.price),
+            func.max(Product.price),
+            *(func.count().filter(condition) for condition in rating_buckets.values())
+        ).order_by(None).one()
         
-        return distribution
+        return {
+            "categories_found": categories_found,
+            "price_range": {
+                "min": float(min_price or 0),
+                "max": float(max_price or 0)
+            },
+            "rating_distribution": dict(zip(rating_buckets, bucket_counts))
+        }
     
     def _get_sales_trend(self, product_id: str, months: int = 12) -> List[Dict[str, Any]]:
         """Get sales trend for a product over specified months"""
-        trend = []
-        current_date = datetime.utcnow()
+        current_month = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        month_starts = [current_month - relativedelta(months=i) for i in reversed(range(months))]
+        window_start, window_end = month_starts[0], current_month + relativedelta(months=1)
+        
+        # Sum every month of the window in one grouped query
+        month = func.date_trunc('month', Order.created_at).label('month')
+        rows = self.db.query(month, func.sum(OrderItem.quantity * OrderItem.unit_price))\
+                      .join(OrderItem, OrderItem.order_id == Order.order_id)\
+                      .filter(
+                          OrderItem.product_id == product_id,
+                          Order.status == 'completed',
+                          Order.created_at >= window_start,
+                          Order.created_at < window_end
+                      ).group_by(month).all()
+        monthly_sales = {row_month.strftime("%Y-%m"): sales for row_month, sales in rows}
         
-        for i in range(months):
-            month_start = current_date.replace(day=1) - timedelta(days=30*i)
-            month_end = month_start.replace(day=28) + timedelta(days=4)
-            month_end = month_end.replace(day=1) - timedelta(days=1)
-            
-            # Get sales for this month
-            month_sales = self.db.query(func.sum(OrderItem.quantity * OrderItem.unit_price))\
-                                 .join(Product, OrderItem.product_id == Product.product_id)\
-                                 .join(Order, OrderItem.order_id == Order.order_id)\
-                                 .filter(
-                                    Product.product_id == product_id,
-                                    Order.status == 'completed',
-                                    Order.created_at >= month_start,
-                                    Order.created_at <= month_end
-                                 ).scalar()
+        trend = []
+        for month_start in month_starts:
+            month_key = month_start.strftime("%Y-%m")
+            month_sales = monthly_sales.get(month_key)
             
             trend.append({
-                "month": month_start.strftime("%Y-%m"),
+                "month": month_key,
                 "sales_amount": float(month_sales) if month_sales else 0.0,
                 "month_name": month_start.strftime("%B %Y")
             })
         
-        return list(reversed(trend))
+        return trend
     
     def _get_top_categories(self, limit: int = 5) -> List[Dict[str, Any]]:
         """Get top product categories by product count"""
@@ -905,27 +1022,38 @@ class ProductService:
         ]
     
     def _get_sales_performance(self, days: int = 30) -> List[Dict[str, Any]]:
-        """Get sales performance data over specified days"""
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        """Get sales performance data over specified days, including days without sales"""
+        start_date = (datetime.utcnow() - timedelta(days=days)).date()
+        
+        series = func.generate_series(start_date, func.current_date(), text("interval '1 day'"))\
+            .table_valued("day").render_derived(name="series")
         
-        # Get daily sales
         daily_sales = self.db.query(
-            func.date(Order.created_at).label('date'),
-            func.sum(OrderItem.quantity * OrderItem.unit_price).label('daily_sales'),
-            func.count(Order.order_id).label('order_count')
+            func.date(Order.created_at).label('day'),
+            func.sum(OrderItem.quantity * OrderItem.unit_price).label('sales_amount'),
+            func.count(func.distinct(Order.order_id)).label('order_count')
         ).join(OrderItem, Order.order_id == OrderItem.order_id)\
          .filter(
             Order.status == 'completed',
-            Order.created_at >= cutoff_date
+            Order.created_at >= start_date
          ).group_by(func.date(Order.created_at))\
-         .order_by(func.date(Order.created_at))\
+         .subquery()
+        
+        # One row per day in the window, zero-filled where there were no sales
+        rows = self.db.query(
+            func.date(series.c.day).label('date'),
+            func.coalesce(daily_sales.c.sales_amount, 0).label('sales_amount'),
+            func.coalesce(daily_sales.c.order_count, 0).label('order_count')
+        ).select_from(series)\
+         .outerjoin(daily_sales, daily_sales.c.day == func.date(series.c.day))\
+         .order_by(series.c.day)\
          .all()
         
         return [
             {
-                "date": sale.date.strftime("%Y-%m-%d"),
-                "sales_amount": float(sale.daily_sales) if sale.daily_sales else 0.0,
-                "order_count": int(sale.order_count) if sale.order_count else 0
+                "date": row.date.strftime("%Y-%m-%d"),
+                "sales_amount": float(row.sales_amount),
+                "order_count": int(row.order_count)
             }
-            for sale in daily_sales
+            for row in rows
         ]
\ No newline at end of file
@@ -0,0 +1,113 @@
+-- =====================================================
+-- Labanita Products Database Update
+-- Denormalised category name, full-text search and supporting indexes for product listings
+-- =====================================================
+
+-- Enable trigram matching for ILIKE '%...%' searches
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- =====================================================
+-- 1. UPDATE PRODUCTS TABLE - Add category_name_cached
+-- =====================================================
+
+-- Add new column to existing products table
+ALTER TABLE products
+ADD COLUMN IF NOT EXISTS category_name_cached VARCHAR(255);
+
+-- Backfill existing products from their category
+UPDATE products p
+SET category_name_cached = c.category_name
+FROM categories c
+WHERE c.category_id = p.category_id
+AND p.category_name_cached IS DISTINCT FROM c.category_name;
+
+-- =====================================================
+-- 2. UPDATE PRODUCTS TABLE - Add full-text search vector
+-- =====================================================
+
+ALTER TABLE products
+ADD COLUMN IF NOT EXISTS search_vec TSVECTOR
+GENERATED ALWAYS AS (
+    to_tsvector('simple', coalesce(product_name, '') || ' ' || coalesce(description, ''))
+) STORED;
+
+-- =====================================================
+-- INDEXES FOR PERFORMANCE OPTIMIZATION
+-- =====================================================
+
+-- Full-text product search
+CREATE INDEX IF NOT EXISTS idx_products_search_vec ON products USING GIN (search_vec);
+
+-- Active product counts per category
+CREATE INDEX IF NOT EXISTS idx_products_category_active ON products(category_id, is_active);
+
+-- Category product pages in display order, without a sort step
+CREATE INDEX IF NOT EXISTS idx_products_category_active_sort ON products(category_id, is_active, sort_order, product_name);
+
+-- Featured, best-selling and new-arrival listings
+CREATE INDEX IF NOT EXISTS idx_products_featured_sort ON products(sort_order, product_name) WHERE is_featured AND is_active;
+CREATE INDEX IF NOT EXISTS idx_products_best_selling_sort ON products(sort_order, product_name) WHERE is_best_selling AND is_active;
+CREATE INDEX IF NOT EXISTS idx_products_new_arrival_created ON products(created_at) WHERE is_new_arrival AND is_active;
+
+-- Daily sales performance over completed orders
+CREATE INDEX IF NOT EXISTS idx_orders_status_created ON orders(order_status, created_at);
+
+-- Substring matches on category names (search suggestions and category filter)
+CREATE INDEX IF NOT EXISTS idx_categories_name_trgm ON categories USING GIN (category_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_products_category_name_trgm ON products USING GIN (category_name_cached gin_trgm_ops);
+
+-- =====================================================
+-- TRIGGERS FOR CATEGORY NAME SYNC
+-- =====================================================
+
+-- Function to copy the category name onto a product when it is created or moved
+CREATE OR REPLACE FUNCTION sync_product_category_name()
+RETURNS TRIGGER AS $$
+BEGIN
+    SELECT category_name INTO NEW.category_name_cached
+    FROM categories
+    WHERE category_id = NEW.category_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_sync_product_category_name ON products;
+CREATE TRIGGER trigger_sync_product_category_name
+    BEFORE INSERT OR UPDATE OF category_id ON products
+    FOR EACH ROW EXECUTE FUNCTION sync_product_category_name();
+
+-- Function to propagate a category rename to its products
+CREATE OR REPLACE FUNCTION propagate_category_name()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE products
+    SET category_name_cached = NEW.category_name
+    WHERE category_id = NEW.category_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_propagate_category_name ON categories;
+CREATE TRIGGER trigger_propagate_category_name
+    AFTER UPDATE OF category_name ON categories
+    FOR EACH ROW
+    WHEN (OLD.category_name IS DISTINCT FROM NEW.category_name)
+    EXECUTE FUNCTION propagate_category_name();
+
+-- =====================================================
+-- COMMENTS FOR DOCUMENTATION
+-- =====================================================
+
+COMMENT ON COLUMN products.category_name_cached IS 'Copy of categories.category_name, maintained by triggers';
+COMMENT ON COLUMN products.search_vec IS 'Full-text search vector over product name and description';
+
+-- =====================================================
+-- VERIFICATION QUERIES
+-- =====================================================
+
+-- Check for products whose cached category name is out of sync
+SELECT
+    COUNT(*) AS out_of_sync_products
+FROM products p
+JOIN categories c ON c.category_id = p.category_id
+WHERE p.category_name_cached IS DISTINCT FROM c.category_name;
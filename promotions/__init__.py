@@ -4,6 +4,8 @@
 from .schemas import (
     PromotionResponse,
     ActivePromotionsResponse,
+    ActivePromotionsSummary,
+    PromotionCartItem,
     PromotionValidationResponse,
     PromotionApplicationResponse,
     PromotionRemovalResponse,
@@ -28,6 +30,8 @@ __all__ = [
     # Schemas
     "PromotionResponse",
     "ActivePromotionsResponse",
+    "ActivePromotionsSummary",
+    "PromotionCartItem",
     "PromotionValidationResponse",
     "PromotionApplicationResponse",
     "PromotionRemovalResponse",
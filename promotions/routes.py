@@ -1,14 +1,18 @@
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from database import get_db
 from core.responses import success_response, error_response
+from core.config import settings
 from core.exceptions import (
     NotFoundException, 
     ValidationException, 
-    ConflictException
+    ConflictException,
+    RateLimitException
 )
+from core.rate_limit import enforce_rate_limit
 from promotions.schemas import (
     ActivePromotionsResponse, PromotionValidationResponse,
     PromotionApplicationResponse, PromotionRemovalResponse,
@@ -18,7 +22,44 @@ from promotions.schemas import (
 from promotions.services import PromotionService
 
 # Create router
-router = APIRouter(prefix="/api/promotions", tags=["Promotions"])
+router = APIRouter(prefix="/api/promotions", tags=["Promotions"], default_response_class=ORJSONResponse)
+
+# Static lookup values served by the utility endpoints
+PROMOTION_TYPES = (
+    "percentage_discount",
+    "fixed_amount_discount",
+    "buy_one_get_one",
+    "buy_x_get_y",
+    "free_shipping",
+    "bundle_discount",
+    "cashback",
+    "loyalty_points",
+    "first_time_purchase",
+    "birthday_offer",
+    "seasonal_sale",
+    "flash_sale"
+)
+
+DISCOUNT_TYPES = (
+    "percentage",
+    "fixed_amount",
+    "free_item",
+    "free_shipping",
+    "cashback",
+    "points"
+)
+
+TRIGGER_TYPES = (
+    "manual",
+    "automatic",
+    "scheduled",
+    "event_based",
+    "user_action",
+    "system_generated"
+)
+
+# Lookup values only change with a deploy, so clients and proxies may cache them for a day
+STATIC_LOOKUP_CACHE_CONTROL = "public, max-age=86400"
 
 # =============================================================================
 # PROMOTION RETRIEVAL ENDPOINTS
@@ -49,7 +90,9 @@ async def get_active_promotions(
             category_id=category_id,
             promotion_type=promotion_type
         )
-        return active_promotions
+        # Already a validated ActivePromotionsResponse: encode it once in pydantic-core
+        # rather than letting FastAPI dump, re-validate and re-encode it
+        return Response(content=active_promotions.model_dump_json(), media_type="application/json")
         
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to get active promotions")
@@ -93,6 +136,8 @@ async def validate_promotion(
         if not request.user_id:
             raise ValidationException("User ID is required")
         
+        enforce_rate_limit("rl:promotion_validate", request.user_id, settings.RATE_LIMIT_PER_MINUTE)
+        
         # If promotion_code is provided, get promotion by code
         if request.promotion_code:
             promotion = promotion_service.get_promotion_by_code(request.promotion_code)
@@ -106,12 +151,14 @@ async def validate_promotion(
             category_ids=request.category_ids,
             cart_total=request.cart_total,
             user_id=request.user_id,
-            user_groups=request.user_groups or [],
-            purchase_history=request.purchase_history or {}
+            user_groups=request.user_groups,
+            purchase_history=request.purchase_history
         )
         
         return validation_result
         
+    except RateLimitException:
+        raise
     except ValidationException as e:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     except NotFoundException as e:
@@ -160,6 +207,8 @@ async def apply_promotion(
         if request.cart_total < 0:
             raise ValidationException("Cart total cannot be negative")
         
+        enforce_rate_limit("rl:promotion_apply", request.user_id, settings.RATE_LIMIT_PER_MINUTE)
+        
         # Apply promotion
         application_result = promotion_service.apply_promotion(
             promotion_id=request.promotion_id,
@@ -171,6 +220,8 @@ async def apply_promotion(
         
         return application_result
         
+    except (RateLimitException, ConflictException):
+        raise
     except ValidationException as e:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     except NotFoundException as e:
@@ -346,7 +397,7 @@ async def get_promotion_analytics(
 # =============================================================================
 
 @router.get("/types/available", response_model=List[str])
-async def get_available_promotion_types():
+async def get_available_promotion_types(response: Response):
     """
     Get available promotion types
     
@@ -363,23 +414,11 @@ async def get_available_promotion_types():
     - Seasonal sales
     - Flash sales
     """
-    return [
-        "percentage_discount",
-        "fixed_amount_discount",
-        "buy_one_get_one",
-        "buy_x_get_y",
-        "free_shipping",
-        "bundle_discount",
-        "cashback",
-        "loyalty_points",
-        "first_time_purchase",
-        "birthday_offer",
-        "seasonal_sale",
-        "flash_sale"
-    ]
+    response.headers["Cache-Control"] = STATIC_LOOKUP_CACHE_CONTROL
+    return PROMOTION_TYPES
 
 @router.get("/discount-types/available", response_model=List[str])
-async def get_available_discount_types():
+async def get_available_discount_types(response: Response):
     """
     Get available discount types
     
@@ -391,17 +430,11 @@ async def get_available_discount_types():
     - Cashback
     - Points
     """
-    return [
-        "percentage",
-        "fixed_amount",
-        "free_item",
-        "free_shipping",
-        "cashback",
-        "points"
-    ]
+    response.headers["Cache-Control"] = STATIC_LOOKUP_CACHE_CONTROL
+    return DISCOUNT_TYPES
 
 @router.get("/trigger-types/available", response_model=List[str])
-async def get_available_trigger_types():
+async def get_available_trigger_types(response: Response):
     """
     Get available promotion trigger types
     
@@ -413,14 +446,8 @@ async def get_available_trigger_types():
     - User action
     - System generated
     """
-    return [
-        "manual",
-        "automatic",
-        "scheduled",
-        "event_based",
-        "user_action",
-        "system_generated"
-    ]
+    response.headers["Cache-Control"] = STATIC_LOOKUP_CACHE_CONTROL
+    return TRIGGER_TYPES
 
 # =============================================================================
 # PROMOTION VALIDATION UTILITIES
@@ -451,18 +478,20 @@ async def validate_cart_for_promotions(
         # Get all active promotions
         active_promotions = promotion_service.get_active_promotions(user_id=user_id)
         
+        # Validate all of them against the cart in one pass
+        validation_results = promotion_service.validate_promotions_bulk(
+            promotion_ids=[promotion.promotion_id for promotion in active_promotions.promotions],
+            product_ids=product_ids,
+            category_ids=category_ids,
+            cart_total=cart_total,
+            user_id=user_id
+        )
+        
         applicable_promotions = []
         total_potential_savings = 0.0
         
         for promotion in active_promotions.promotions:
-            # Validate each promotion
-            validation_result = promotion_service.validate_promotion(
-                promotion_id=promotion.promotion_id,
-                product_ids=product_ids,
-                category_ids=category_ids,
-                cart_total=cart_total,
-                user_id=user_id
-            )
+            validation_result = validation_results[promotion.promotion_id]
             
             if validation_result.is_valid:
                 applicable_promotions.append({
@@ -1,14 +1,21 @@
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 from decimal import Decimal
-from pydantic import BaseModel, Field, validator
-from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, computed_field, field_validator
+
+try:
+    from enum import StrEnum
+except ImportError:  # Python < 3.11
+    from enum import Enum
+
+    class StrEnum(str, Enum):
+        """String-valued enum, as provided by the standard library from Python 3.11"""
 
 # =============================================================================
 # ENUMS
 # =============================================================================
 
-class PromotionType(str, Enum):
+class PromotionType(StrEnum):
     """Promotion type values"""
     PERCENTAGE_DISCOUNT = "percentage_discount"
     FIXED_AMOUNT_DISCOUNT = "fixed_amount_discount"
@@ -23,7 +30,7 @@ class PromotionType(str, Enum):
     SEASONAL_SALE = "seasonal_sale"
     FLASH_SALE = "flash_sale"
 
-class PromotionStatus(str, Enum):
+class PromotionStatus(StrEnum):
     """Promotion status values"""
     ACTIVE = "active"
     INACTIVE = "inactive"
@@ -32,7 +39,7 @@ class PromotionStatus(str, Enum):
     PAUSED = "paused"
     DEPLETED = "depleted"
 
-class DiscountType(str, Enum):
+class DiscountType(StrEnum):
     """Discount type values"""
     PERCENTAGE = "percentage"
     FIXED_AMOUNT = "fixed_amount"
@@ -41,7 +48,7 @@ class DiscountType(str, Enum):
     CASHBACK = "cashback"
     POINTS = "points"
 
-class PromotionTrigger(str, Enum):
+class PromotionTrigger(StrEnum):
     """Promotion trigger values"""
     MANUAL = "manual"
     AUTOMATIC = "automatic"
@@ -84,8 +91,16 @@ class PromotionResponse(BaseModel):
     created_at: datetime = Field(..., description="When promotion was created")
     updated_at: datetime = Field(..., description="When promotion was last updated")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, use_enum_values=True)
+
+class ActivePromotionsSummary(BaseModel):
+    """Summary figures for the active promotions"""
+    total_promotions: int = Field(..., description="Number of active promotions")
+    total_discount_value: float = Field(..., description="Sum of the promotions' discount values")
+    promotion_types: List[PromotionType] = Field(..., description="Promotion types among the active promotions")
+    average_priority: float = Field(..., description="Average promotion priority")
+    
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
 
 class ActivePromotionsResponse(BaseModel):
     """Response schema for active promotions"""
@@ -93,8 +108,10 @@ class ActivePromotionsResponse(BaseModel):
     total_count: int = Field(..., description="Total number of active promotions")
     categories_with_promotions: List[str] = Field(..., description="Categories that have active promotions")
     promotion_types_available: List[PromotionType] = Field(..., description="Types of promotions available")
-    summary: Dict[str, Any] = Field(..., description="Summary of active promotions")
+    summary: ActivePromotionsSummary = Field(..., description="Summary of active promotions")
     user_specific_promotions: List[PromotionResponse] = Field(..., description="Promotions specific to current user")
+    
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
 
 class PromotionValidationRequest(BaseModel):
     """Request schema for validating promotion applicability"""
@@ -103,8 +120,8 @@ class PromotionValidationRequest(BaseModel):
     category_ids: List[str] = Field(..., description="Category IDs to check")
     cart_total: float = Field(..., ge=0, description="Cart total amount")
     user_id: str = Field(..., description="User ID for validation")
-    user_groups: List[str] = Field(..., description="User groups for validation")
-    purchase_history: Dict[str, Any] = Field(..., description="User purchase history")
+    user_groups: List[str] = Field(default_factory=list, description="User groups for validation")
+    purchase_history: Dict[str, Any] = Field(default_factory=dict, description="User purchase history")
 
 class PromotionValidationResponse(BaseModel):
     """Response schema for promotion validation results"""
@@ -119,11 +136,22 @@ class PromotionValidationResponse(BaseModel):
     recommendations: List[str] = Field(..., description="Recommendations for better promotions")
     terms_and_conditions: List[str] = Field(..., description="Terms and conditions for the promotion")
 
+class PromotionCartItem(BaseModel):
+    """Cart line item that a promotion is applied to or removed from"""
+    product_id: Optional[str] = Field(None, description="Product ID")
+    category_id: Optional[str] = Field(None, description="Category ID of the product")
+    price: float = Field(0.0, description="Unit price")
+    quantity: int = Field(1, description="Quantity in cart")
+    applied_discount: Optional[float] = Field(None, description="Discount applied to this item")
+    final_price: Optional[float] = Field(None, description="Price after the applied discount")
+    
+    model_config = ConfigDict(extra="allow")
+
 class PromotionApplicationRequest(BaseModel):
     """Request schema for applying promotion"""
     promotion_id: str = Field(..., description="Promotion ID to apply")
     user_id: str = Field(..., description="User ID applying the promotion")
-    cart_items: List[Dict[str, Any]] = Field(..., description="Cart items to apply promotion to")
+    cart_items: List[PromotionCartItem] = Field(..., description="Cart items to apply promotion to")
     cart_total: float = Field(..., ge=0, description="Cart total amount")
     session_id: Optional[str] = Field(None, description="Session ID for tracking")
 
@@ -136,7 +164,7 @@ class PromotionApplicationResponse(BaseModel):
     discount_percentage: float = Field(..., description="Total discount percentage")
     final_cart_total: float = Field(..., description="Final cart total after promotion")
     savings_amount: float = Field(..., description="Total amount saved")
-    applied_items: List[Dict[str, Any]] = Field(..., description="Items that had promotion applied")
+    applied_items: List[PromotionCartItem] = Field(..., description="Items that had promotion applied")
     remaining_usage: Optional[int] = Field(None, description="Remaining usage for user")
     expiration_time: Optional[datetime] = Field(None, description="When promotion expires")
     message: str = Field(..., description="Application result message")
@@ -146,7 +174,7 @@ class PromotionRemovalRequest(BaseModel):
     """Request schema for removing promotion"""
     promotion_id: str = Field(..., description="Promotion ID to remove")
     user_id: str = Field(..., description="User ID removing the promotion")
-    cart_items: List[Dict[str, Any]] = Field(..., description="Cart items to remove promotion from")
+    cart_items: List[PromotionCartItem] = Field(..., description="Cart items to remove promotion from")
     reason: Optional[str] = Field(None, description="Reason for removal")
 
 class PromotionRemovalResponse(BaseModel):
@@ -157,7 +185,7 @@ class PromotionRemovalResponse(BaseModel):
     original_cart_total: float = Field(..., description="Original cart total before promotion")
     new_cart_total: float = Field(..., description="New cart total after removal")
     removed_discount: float = Field(..., description="Discount amount that was removed")
-    affected_items: List[Dict[str, Any]] = Field(..., description="Items that were affected")
+    affected_items: List[PromotionCartItem] = Field(..., description="Items that were affected")
     message: str = Field(..., description="Removal result message")
 
 # =============================================================================
@@ -175,31 +203,35 @@ class PromotionCreateRequest(BaseModel):
     max_discount_amount: Optional[float] = Field(None, ge=0, description="Maximum discount amount")
     buy_quantity: Optional[int] = Field(None, ge=1, description="Quantity to buy for BOGO promotions")
     get_quantity: Optional[int] = Field(None, ge=1, description="Quantity to get for BOGO promotions")
-    applicable_products: List[str] = Field(default=[], description="List of applicable product IDs")
-    applicable_categories: List[str] = Field(default=[], description="List of applicable category IDs")
-    excluded_products: List[str] = Field(default=[], description="List of excluded product IDs")
-    excluded_categories: List[str] = Field(default=[], description="List of excluded category IDs")
-    user_groups: List[str] = Field(default=[], description="User groups eligible for promotion")
+    applicable_products: List[str] = Field(default_factory=list, description="List of applicable product IDs")
+    applicable_categories: List[str] = Field(default_factory=list, description="List of applicable category IDs")
+    excluded_products: List[str] = Field(default_factory=list, description="List of excluded product IDs")
+    excluded_categories: List[str] = Field(default_factory=list, description="List of excluded category IDs")
+    user_groups: List[str] = Field(default_factory=list, description="User groups eligible for promotion")
     usage_limit_per_user: Optional[int] = Field(None, ge=1, description="Usage limit per user")
     total_usage_limit: Optional[int] = Field(None, ge=1, description="Total usage limit")
     start_date: datetime = Field(..., description="Promotion start date")
     end_date: datetime = Field(..., description="Promotion end date")
     priority: int = Field(1, ge=1, le=100, description="Promotion priority")
     trigger_type: PromotionTrigger = Field(PromotionTrigger.MANUAL, description="How promotion is triggered")
-    conditions: Dict[str, Any] = Field(default={}, description="Additional promotion conditions")
+    conditions: Dict[str, Any] = Field(default_factory=dict, description="Additional promotion conditions")
+    
+    model_config = ConfigDict(use_enum_values=True)
     
-    @validator('end_date')
-    def validate_end_date(cls, v, values):
-        if 'start_date' in values and v <= values['start_date']:
+    @field_validator('end_date')
+    @classmethod
+    def validate_end_date(cls, v, info: ValidationInfo):
+        if 'start_date' in info.data and v <= info.data['start_date']:
             raise ValueError('End date must be after start date')
         return v
     
-    @validator('discount_value')
-    def validate_discount_value(cls, v, values):
-        if 'discount_type' in values:
-            if values['discount_type'] == DiscountType.PERCENTAGE and v > 100:
+    @field_validator('discount_value')
+    @classmethod
+    def validate_discount_value(cls, v, info: ValidationInfo):
+        if 'discount_type' in info.data:
+            if info.data['discount_type'] == "percentage" and v > 100:
                 raise ValueError('Percentage discount cannot exceed 100%')
-            if values['discount_type'] == DiscountType.FIXED_AMOUNT and v <= 0:
+            if info.data['discount_type'] == "fixed_amount" and v <= 0:
                 raise ValueError('Fixed amount discount must be greater than 0')
         return v
 
@@ -225,6 +257,8 @@ class PromotionUpdateRequest(BaseModel):
     trigger_type: Optional[PromotionTrigger] = Field(None, description="How promotion is triggered")
     conditions: Optional[Dict[str, Any]] = Field(None, description="Additional promotion conditions")
     is_active: Optional[bool] = Field(None, description="Whether promotion is active")
+    
+    model_config = ConfigDict(use_enum_values=True)
 
 # =============================================================================
 # FILTER SCHEMAS
@@ -249,60 +283,8 @@ class PromotionFilter(BaseModel):
     search: Optional[str] = Field(None, description="Search in promotion name and description")
     sort_by: str = Field("priority", description="Sort field")
     sort_order: str = Field("desc", description="Sort order (asc/desc)")
-
-# =============================================================================
-# INTERNAL SCHEMAS
-# =============================================================================
-
-class PromotionCreate(BaseModel):
-    """Internal schema for creating promotion"""
-    promotion_name: str
-    description: Optional[str] = None
-    promotion_type: PromotionType
-    discount_type: DiscountType
-    discount_value: float
-    min_purchase_amount: Optional[float] = None
-    max_discount_amount: Optional[float] = None
-    buy_quantity: Optional[int] = None
-    get_quantity: Optional[int] = None
-    applicable_products: List[str] = []
-    applicable_categories: List[str] = []
-    excluded_products: List[str] = []
-    excluded_categories: List[str] = []
-    user_groups: List[str] = []
-    usage_limit_per_user: Optional[int] = None
-    total_usage_limit: Optional[int] = None
-    start_date: datetime
-    end_date: datetime
-    priority: int = 1
-    trigger_type: PromotionTrigger = PromotionTrigger.MANUAL
-    conditions: Dict[str, Any] = {}
-    is_active: bool = True
-    status: PromotionStatus = PromotionStatus.SCHEDULED
-
-class PromotionUpdate(BaseModel):
-    """Internal schema for updating promotion"""
-    promotion_name: Optional[str] = None
-    description: Optional[str] = None
-    discount_value: Optional[float] = None
-    min_purchase_amount: Optional[float] = None
-    max_discount_amount: Optional[float] = None
-    buy_quantity: Optional[int] = None
-    get_quantity: Optional[int] = None
-    applicable_products: Optional[List[str]] = None
-    applicable_categories: Optional[List[str]] = None
-    excluded_products: Optional[List[str]] = None
-    excluded_categories: Optional[List[str]] = None
-    user_groups: Optional[List[str]] = None
-    usage_limit_per_user: Optional[int] = None
-    total_usage_limit: Optional[int] = None
-    start_date: Optional[datetime] = None
-    end_date: Optional[datetime] = None
-    priority: Optional[int] = None
-    trigger_type: Optional[PromotionTrigger] = None
-    conditions: Optional[Dict[str, Any]] = None
-    is_active: Optional[bool] = None
-    status: Optional[PromotionStatus] = None
+    
+    model_config = ConfigDict(use_enum_values=True)
 
 # =============================================================================
 # PAGINATION SCHEMAS
@@ -323,9 +305,21 @@ class PaginatedPromotionsResponse(BaseModel):
     page: int = Field(..., description="Current page number")
     size: int = Field(..., description="Page size")
     total: int = Field(..., description="Total number of promotions")
-    pages: int = Field(..., description="Total number of pages")
-    has_next: bool = Field(..., description="Whether there is a next page")
-    has_prev: bool = Field(..., description="Whether there is a previous page")
+    
+    @computed_field(description="Total number of pages")
+    @property
+    def pages(self) -> int:
+        return -(-self.total // self.size) if self.size else 0
+    
+    @computed_field(description="Whether there is a next page")
+    @property
+    def has_next(self) -> bool:
+        return self.page * self.size < self.total
+    
+    @computed_field(description="Whether there is a previous page")
+    @property
+    def has_prev(self) -> bool:
+        return self.page > 1
 
 # =============================================================================
 # STATISTICS SCHEMAS
@@ -342,6 +336,8 @@ class PromotionStatsResponse(BaseModel):
     user_engagement: int = Field(..., description="Number of unique users who used this promotion")
     revenue_impact: float = Field(..., description="Revenue impact of this promotion")
     performance_score: float = Field(..., description="Overall performance score")
+    
+    model_config = ConfigDict(frozen=True)
 
 class PromotionAnalyticsResponse(BaseModel):
     """Response schema for promotion analytics"""
@@ -355,6 +351,8 @@ class PromotionAnalyticsResponse(BaseModel):
     top_performing_promotions: List[Dict[str, Any]] = Field(..., description="Top performing promotions")
     promotion_type_distribution: Dict[str, int] = Field(..., description="Distribution of promotion types")
     category_performance: List[Dict[str, Any]] = Field(..., description="Category performance with promotions")
+    
+    model_config = ConfigDict(frozen=True)
 
 # =============================================================================
 # USER PROMOTION SCHEMAS
@@ -380,8 +378,7 @@ class UserPromotionResponse(BaseModel):
     priority: int = Field(..., description="Promotion priority")
     estimated_savings: float = Field(..., description="Estimated savings if applied")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, use_enum_values=True)
 
 class UserPromotionsResponse(BaseModel):
     """Response schema for user promotions list"""
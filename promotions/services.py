@@ -1,24 +1,76 @@
 import uuid
+import threading
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, asc, and_, or_, text, case
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Set, Tuple, NamedTuple, FrozenSet, Sequence
+import cachetools
+from cachetools.keys import hashkey
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import func, desc, asc, and_, or_, text, case, bindparam, false, String
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import IntegrityError
+from pydantic import TypeAdapter
 
+from core.cache import cached, idempotent, invalidate_cache
 from core.exceptions import (
     NotFoundException, 
     ValidationException, 
     ConflictException
 )
-from models import Promotion, Product, Category, User
+from models import Promotion, Product, Category, User, Order
 from promotions.schemas import (
     PromotionResponse, ActivePromotionsResponse, PromotionValidationResponse,
     PromotionApplicationResponse, PromotionRemovalResponse, UserPromotionResponse,
-    UserPromotionsResponse, PromotionCreate, PromotionUpdate, PromotionFilter,
+    UserPromotionsResponse, PromotionFilter,
     PaginationParams, PaginatedPromotionsResponse, PromotionStatsResponse,
-    PromotionAnalyticsResponse
+    PromotionAnalyticsResponse, ActivePromotionsSummary, PromotionCartItem
 )
 
+# Redis key prefixes of cached promotion reads, cleared whenever promotions are written
+PROMOTION_CACHE_PREFIXES = ("active_promotions",)
+
+# Process-local cache for rendered terms, keyed by promotion and its last update so edits are picked up
+_terms_cache = cachetools.TTLCache(maxsize=1024, ttl=3600)
+_terms_lock = threading.Lock()
+
+# Validates a whole list of promotion payloads in one pydantic-core call
+PROMOTION_LIST_ADAPTER = TypeAdapter(List[PromotionResponse])
+
+@lru_cache(maxsize=4)
+def _active_promotion_criteria(by_category: bool, by_type: bool) -> Tuple[Any, ...]:
+    """
+    Build the WHERE criteria for one active-promotions filter shape.
+    Only the presence of the optional filters changes the SQL, so it is built once per shape
+    and the current time and filter values are supplied as bind parameters at execution time.
+    """
+    criteria = [
+        Promotion.is_active == True,
+        Promotion.start_date <= bindparam("now"),
+        Promotion.end_date >= bindparam("now"),
+        Promotion.status == "active"
+    ]
+    
+    if by_category:
+        criteria.append(Promotion.applicable_categories.op("@>")(bindparam("category_ids", type_=ARRAY(String))))
+    
+    if by_type:
+        criteria.append(Promotion.promotion_type == bindparam("promotion_type"))
+    
+    return tuple(criteria)
+
+class PromotionTargets(NamedTuple):
+    """A promotion's product and category ID lists as sets, for per-item membership checks"""
+    applicable_products: FrozenSet[str]
+    applicable_categories: FrozenSet[str]
+    excluded_products: FrozenSet[str]
+    excluded_categories: FrozenSet[str]
+
+class DiscountTerms(NamedTuple):
+    """A promotion's discount settings as plain floats, for per-item discount calculation"""
+    discount_type: str
+    discount_value: float
+    max_discount_amount: Optional[float]
+
 class PromotionService:
     """Promotion service for promotion management, validation, and application"""
     
@@ -29,6 +81,7 @@ class PromotionService:
     # PROMOTION RETRIEVAL
     # =============================================================================
     
+    @cached("active_promotions", ttl=60, response_model=ActivePromotionsResponse)
     def get_active_promotions(
         self,
         user_id: Optional[str] = None,
@@ -36,40 +89,35 @@ class PromotionService:
         promotion_type: Optional[str] = None
     ) -> ActivePromotionsResponse:
         """Get all currently active promotions"""
-        query = self.db.query(Promotion).filter(
-            and_(
-                Promotion.is_active == True,
-                Promotion.start_date <= datetime.utcnow(),
-                Promotion.end_date >= datetime.utcnow(),
-                Promotion.status == "active"
-            )
-        )
-        
-        # Apply additional filters
+        criteria = _active_promotion_criteria(bool(category_id), bool(promotion_type))
+        params = {"now": datetime.utcnow()}
         if category_id:
-            query = query.filter(Promotion.applicable_categories.contains([category_id]))
-        
+            params["category_ids"] = [category_id]
         if promotion_type:
-            query = query.filter(Promotion.promotion_type == promotion_type)
+            params["promotion_type"] = promotion_type
         
-        # Order by priority
-        promotions = query.order_by(desc(Promotion.priority)).all()
+        # Order by priority; relationships are never needed here, so any lazy load is a bug
+        promotions = self.db.query(Promotion).options(raiseload('*')).filter(
+            *criteria
+        ).params(**params).order_by(desc(Promotion.priority)).all()
         
-        promotion_responses = [self._build_promotion_response(promotion) for promotion in promotions]
+        promotion_responses = PROMOTION_LIST_ADAPTER.validate_python(
+            [self._promotion_response_data(promotion) for promotion in promotions]
+        )
+        
+        # Collect category IDs, types and summary figures in one pass
+        category_ids, summary = self._summarize_active_promotions(promotions)
         
         # Get categories with promotions
-        categories_with_promotions = self._get_categories_with_promotions(promotions)
+        categories_with_promotions = self._get_category_names(category_ids)
         
         # Get promotion types available
-        promotion_types_available = list(set(promotion.promotion_type for promotion in promotions))
-        
-        # Build summary
-        summary = self._build_active_promotions_summary(promotions)
+        promotion_types_available = summary.promotion_types
         
         # Get user-specific promotions if user_id provided
         user_specific_promotions = []
         if user_id:
-            user_specific_promotions = self._get_user_specific_promotions(user_id, promotions)
+            user_specific_promotions = self._get_user_specific_promotions(user_id, promotions, promotion_responses)
         
         return ActivePromotionsResponse(
             promotions=promotion_responses,
@@ -114,165 +162,180 @@ class PromotionService:
     ) -> PromotionValidationResponse:
         """Validate if a promotion can be applied"""
         try:
-            # Get promotion
-            promotion = self.db.query(Promotion).filter(Promotion.promotion_id == promotion_id).first()
+            # Get promotion; validation reads columns only, so any relationship load is a bug
+            promotion = self.db.query(Promotion).options(raiseload('*')).filter(
+                Promotion.promotion_id == promotion_id
+            ).first()
             
-            if not promotion:
-                return PromotionValidationResponse(
-                    is_valid=False,
-                    promotion=None,
-                    discount_amount=0.0,
-                    discount_percentage=0.0,
-                    final_price=cart_total,
-                    savings_amount=0.0,
-                    validation_errors=["Promotion not found"],
-                    warnings=[],
-                    recommendations=[],
-                    terms_and_conditions=[]
-                )
-            
-            # Check if promotion is active
-            if not promotion.is_active or promotion.status != "active":
-                return PromotionValidationResponse(
-                    is_valid=False,
-                    promotion=self._build_promotion_response(promotion),
-                    discount_amount=0.0,
-                    discount_percentage=0.0,
-                    final_price=cart_total,
-                    savings_amount=0.0,
-                    validation_errors=["Promotion is not active"],
-                    warnings=[],
-                    recommendations=[],
-                    terms_and_conditions=[]
-                )
+            return self._evaluate_promotion(
+                promotion, product_ids, category_ids, cart_total, user_id, user_groups, purchase_history
+            )
             
-            # Check date validity
+        except Exception as e:
+            raise ValidationException(f"Failed to validate promotion: {str(e)}")
+    
+    def validate_promotions_bulk(
+        self,
+        promotion_ids: List[str],
+        product_ids: List[str],
+        category_ids: List[str],
+        cart_total: float,
+        user_id: str,
+        user_groups: List[str] = None,
+        purchase_history: Dict[str, Any] = None
+    ) -> Dict[str, PromotionValidationResponse]:
+        """Validate several promotions against one cart, loading them in a single query"""
+        try:
+            promotions = self.db.query(Promotion).options(raiseload('*')).filter(
+                Promotion.promotion_id.in_(promotion_ids)
+            ).all()
+            promotions_by_id = {str(promotion.promotion_id): promotion for promotion in promotions}
+            usage_counts = self._get_user_promotion_usage_counts(user_id, list(promotions_by_id))
+            
+            # Build the cart lookups once; frozenset() of a frozenset reuses it
+            product_ids, category_ids = frozenset(product_ids), frozenset(category_ids)
             now = datetime.utcnow()
-            if now < promotion.start_date or now > promotion.end_date:
-                return PromotionValidationResponse(
-                    is_valid=False,
-                    promotion=self._build_promotion_response(promotion),
-                    discount_amount=0.0,
-                    discount_percentage=0.0,
-                    final_price=cart_total,
-                    savings_amount=0.0,
-                    validation_errors=["Promotion is not valid at this time"],
-                    warnings=[],
-                    recommendations=[],
-                    terms_and_conditions=[]
-                )
-            
-            # Check minimum purchase amount
-            if promotion.min_purchase_amount and cart_total < promotion.min_purchase_amount:
-                return PromotionValidationResponse(
-                    is_valid=False,
-                    promotion=self._build_promotion_response(promotion),
-                    discount_amount=0.0,
-                    discount_percentage=0.0,
-                    final_price=cart_total,
-                    savings_amount=0.0,
-                    validation_errors=[f"Cart total must be at least ${promotion.min_purchase_amount}"],
-                    warnings=[],
-                    recommendations=[f"Add ${promotion.min_purchase_amount - cart_total:.2f} more to cart"],
-                    terms_and_conditions=[]
-                )
-            
-            # Check user eligibility
-            if not self._is_user_eligible(promotion, user_id, user_groups, purchase_history):
-                return PromotionValidationResponse(
-                    is_valid=False,
-                    promotion=self._build_promotion_response(promotion),
-                    discount_amount=0.0,
-                    discount_percentage=0.0,
-                    final_price=cart_total,
-                    savings_amount=0.0,
-                    validation_errors=["User is not eligible for this promotion"],
-                    warnings=[],
-                    recommendations=[],
-                    terms_and_conditions=[]
-                )
-            
-            # Check if promotion applies to cart items
-            if not self._is_promotion_applicable_to_cart(promotion, product_ids, category_ids):
-                return PromotionValidationResponse(
-                    is_valid=False,
-                    promotion=self._build_promotion_response(promotion),
-                    discount_amount=0.0,
-                    discount_percentage=0.0,
-                    final_price=cart_total,
-                    savings_amount=0.0,
-                    validation_errors=["Promotion does not apply to cart items"],
-                    warnings=[],
-                    recommendations=[],
-                    terms_and_conditions=[]
-                )
             
-            # Check usage limits
-            if not self._check_usage_limits(promotion, user_id):
-                return PromotionValidationResponse(
-                    is_valid=False,
-                    promotion=self._build_promotion_response(promotion),
-                    discount_amount=0.0,
-                    discount_percentage=0.0,
-                    final_price=cart_total,
-                    savings_amount=0.0,
-                    validation_errors=["Usage limit exceeded for this promotion"],
-                    warnings=[],
-                    recommendations=[],
-                    terms_and_conditions=[]
+            return {
+                str(promotion_id): self._evaluate_promotion(
+                    promotions_by_id.get(str(promotion_id)), product_ids, category_ids,
+                    cart_total, user_id, user_groups, purchase_history, usage_counts, now
                 )
-            
-            # Calculate discount
-            discount_amount, discount_percentage = self._calculate_discount(promotion, cart_total)
-            final_price = cart_total - discount_amount
-            savings_amount = discount_amount
-            
-            # Build terms and conditions
-            terms_and_conditions = self._build_terms_and_conditions(promotion)
-            
-            return PromotionValidationResponse(
-                is_valid=True,
-                promotion=self._build_promotion_response(promotion),
-                discount_amount=discount_amount,
-                discount_percentage=discount_percentage,
-                final_price=final_price,
-                savings_amount=savings_amount,
-                validation_errors=[],
-                warnings=[],
-                recommendations=[],
-                terms_and_conditions=terms_and_conditions
-            )
+                for promotion_id in promotion_ids
+            }
             
         except Exception as e:
-            raise ValidationException(f"Failed to validate promotion: {str(e)}")
+            raise ValidationException(f"Failed to validate promotions: {str(e)}")
+    
+    def _evaluate_promotion(
+        self,
+        promotion: Optional[Promotion],
+        product_ids: List[str],
+        category_ids: List[str],
+        cart_total: float,
+        user_id: str,
+        user_groups: List[str] = None,
+        purchase_history: Dict[str, Any] = None,
+        usage_counts: Optional[Dict[uuid.UUID, int]] = None,
+        now: Optional[datetime] = None
+    ) -> PromotionValidationResponse:
+        """Evaluate validation rules for an already loaded promotion"""
+        if promotion is None:
+            return self._invalid_validation_response(None, cart_total, ["Promotion not found"])
+        
+        promotion_response = self._build_promotion_response(promotion)
+        
+        # Check if promotion is active
+        if not promotion.is_active or promotion.status != "active":
+            return self._invalid_validation_response(promotion_response, cart_total, ["Promotion is not active"])
+        
+        # Check date validity
+        now = now or datetime.utcnow()
+        if now < promotion.start_date or now > promotion.end_date:
+            return self._invalid_validation_response(
+                promotion_response, cart_total, ["Promotion is not valid at this time"]
+            )
+        
+        # Check minimum purchase amount
+        if promotion.min_purchase_amount and cart_total < promotion.min_purchase_amount:
+            return self._invalid_validation_response(
+                promotion_response, cart_total,
+                [f"Cart total must be at least ${promotion.min_purchase_amount}"],
+                [f"Add ${promotion.min_purchase_amount - cart_total:.2f} more to cart"]
+            )
+        
+        # Check user eligibility
+        if not self._is_user_eligible(promotion, user_id, user_groups, purchase_history, usage_counts):
+            return self._invalid_validation_response(
+                promotion_response, cart_total, ["User is not eligible for this promotion"]
+            )
+        
+        # Check if promotion applies to cart items
+        if not self._is_promotion_applicable_to_cart(promotion, product_ids, category_ids):
+            return self._invalid_validation_response(
+                promotion_response, cart_total, ["Promotion does not apply to cart items"]
+            )
+        
+        # Check usage limits
+        if not self._check_usage_limits(promotion, user_id, usage_counts):
+            return self._invalid_validation_response(
+                promotion_response, cart_total, ["Usage limit exceeded for this promotion"]
+            )
+        
+        # Calculate discount
+        discount_amount, discount_percentage = self._calculate_discount(promotion, cart_total)
+        final_price = cart_total - discount_amount
+        savings_amount = discount_amount
+        
+        # Build terms and conditions
+        terms_and_conditions = self._build_terms_and_conditions(promotion)
+        
+        return PromotionValidationResponse(
+            is_valid=True,
+            promotion=promotion_response,
+            discount_amount=discount_amount,
+            discount_percentage=discount_percentage,
+            final_price=final_price,
+            savings_amount=savings_amount,
+            validation_errors=[],
+            warnings=[],
+            recommendations=[],
+            terms_and_conditions=terms_and_conditions
+        )
+    
+    def _invalid_validation_response(
+        self,
+        promotion_response: Optional[PromotionResponse],
+        cart_total: float,
+        errors: List[str],
+        recommendations: Sequence[str] = ()
+    ) -> PromotionValidationResponse:
+        """Build the response for a promotion that failed validation"""
+        return PromotionValidationResponse(
+            is_valid=False,
+            promotion=promotion_response,
+            discount_amount=0.0,
+            discount_percentage=0.0,
+            final_price=cart_total,
+            savings_amount=0.0,
+            validation_errors=errors,
+            warnings=[],
+            recommendations=list(recommendations),
+            terms_and_conditions=[]
+        )
     
     # =============================================================================
     # PROMOTION APPLICATION
     # =============================================================================
     
+    @idempotent("promotion_apply", ttl=60, response_model=PromotionApplicationResponse)
     def apply_promotion(
         self,
         promotion_id: str,
         user_id: str,
-        cart_items: List[Dict[str, Any]],
+        cart_items: List[PromotionCartItem],
         cart_total: float,
         session_id: Optional[str] = None
     ) -> PromotionApplicationResponse:
         """Apply a promotion to cart items"""
         try:
-            # Get promotion
-            promotion = self.db.query(Promotion).filter(Promotion.promotion_id == promotion_id).first()
+            # Get promotion; only its columns are read, so any relationship load is a bug
+            promotion = self.db.query(Promotion).options(raiseload('*')).filter(
+                Promotion.promotion_id == promotion_id
+            ).first()
             
             if not promotion:
                 raise NotFoundException(f"Promotion with ID {promotion_id} not found")
             
-            # Validate promotion can be applied
-            validation_result = self.validate_promotion(
-                promotion_id=promotion_id,
-                product_ids=[item.get('product_id') for item in cart_items],
-                category_ids=[item.get('category_id') for item in cart_items if item.get('category_id')],
+            # Validate the already loaded promotion can be applied
+            usage_counts = self._get_user_promotion_usage_counts(user_id, [promotion_id])
+            validation_result = self._evaluate_promotion(
+                promotion,
+                product_ids=[item.product_id for item in cart_items],
+                category_ids=[item.category_id for item in cart_items if item.category_id],
                 cart_total=cart_total,
-                user_id=user_id
+                user_id=user_id,
+                usage_counts=usage_counts
             )
             
             if not validation_result.is_valid:
@@ -282,17 +345,34 @@ class PromotionService:
             applied_items = []
             total_discount = 0.0
             
+            targets = self._promotion_targets(promotion)
+            terms = self._discount_terms(promotion)
             for item in cart_items:
-                if self._is_item_eligible_for_promotion(promotion, item):
-                    item_discount = self._calculate_item_discount(promotion, item)
-                    item['applied_discount'] = item_discount
-                    item['final_price'] = item.get('price', 0) - item_discount
+                if self._is_item_eligible_for_promotion(targets, item):
+                    item_discount = self._calculate_item_discount(terms, item)
+                    item.applied_discount = item_discount
+                    item.final_price = item.price - item_discount
                     total_discount += item_discount
                     applied_items.append(item)
             
-            # Update promotion usage count
-            promotion.current_usage_count += 1
+            # Update promotion usage count in place, re-checking the total limit so concurrent applies cannot overshoot it
+            updated_count = self.db.query(Promotion).filter(
+                Promotion.promotion_id == promotion_id,
+                or_(
+                    Promotion.total_usage_limit.is_(None),
+                    Promotion.total_usage_limit == 0,
+                    func.coalesce(Promotion.current_usage_count, 0) < Promotion.total_usage_limit
+                )
+            ).update({
+                "current_usage_count": func.coalesce(Promotion.current_usage_count, 0) + 1
+            }, synchronize_session=False)
+            
+            if not updated_count:
+                self.db.rollback()
+                raise ConflictException("Usage limit exceeded for this promotion")
+            
             self.db.commit()
+            invalidate_cache(*PROMOTION_CACHE_PREFIXES)
             
             # Calculate final totals
             final_cart_total = cart_total - total_discount
@@ -301,7 +381,7 @@ class PromotionService:
             # Get remaining usage for user
             remaining_usage = None
             if promotion.usage_limit_per_user:
-                current_usage = self._get_user_promotion_usage(promotion_id, user_id)
+                current_usage = self._resolve_user_promotion_usage(promotion, user_id, usage_counts)
                 remaining_usage = max(0, promotion.usage_limit_per_user - current_usage)
             
             return PromotionApplicationResponse(
@@ -319,7 +399,7 @@ class PromotionService:
                 warnings=[]
             )
             
-        except (NotFoundException, ValidationException):
+        except (NotFoundException, ValidationException, ConflictException):
             raise
         except Exception as e:
             self.db.rollback()
@@ -333,7 +413,7 @@ class PromotionService:
         self,
         promotion_id: str,
         user_id: str,
-        cart_items: List[Dict[str, Any]],
+        cart_items: List[PromotionCartItem],
         reason: Optional[str] = None
     ) -> PromotionRemovalResponse:
         """Remove a promotion from cart items"""
@@ -345,17 +425,17 @@ class PromotionService:
                 raise NotFoundException(f"Promotion with ID {promotion_id} not found")
             
             # Calculate original cart total
-            original_cart_total = sum(item.get('price', 0) for item in cart_items)
+            original_cart_total = sum(item.price for item in cart_items)
             
             # Remove promotion from cart items
             affected_items = []
             removed_discount = 0.0
             
             for item in cart_items:
-                if item.get('applied_discount'):
-                    removed_discount += item.get('applied_discount', 0)
-                    item['applied_discount'] = 0
-                    item['final_price'] = item.get('price', 0)
+                if item.applied_discount:
+                    removed_discount += item.applied_discount
+                    item.applied_discount = 0
+                    item.final_price = item.price
                     affected_items.append(item)
             
             # Calculate new cart total
@@ -389,15 +469,36 @@ class PromotionService:
             if not user:
                 raise NotFoundException(f"User with ID {user_id} not found")
             
-            # Get all active promotions
-            active_promotions = self.db.query(Promotion).filter(
+            # Join the user's per-promotion usage so the per-user limit is checked in SQL too
+            now = datetime.utcnow()
+            usage = self._user_promotion_usage_subquery(user_id)
+            usage_count = func.coalesce(usage.c.usage_count, 0)
+            
+            # Get active promotions the user could be eligible for
+            active_rows = self.db.query(Promotion, usage_count).options(raiseload('*')).outerjoin(
+                usage, usage.c.promotion_id == Promotion.promotion_id
+            ).filter(
+                self._build_eligibility_filter(user_groups=[]),
+                or_(
+                    Promotion.usage_limit_per_user.is_(None),
+                    Promotion.usage_limit_per_user == 0,
+                    usage_count < Promotion.usage_limit_per_user
+                )
+            ).params(now=now).order_by(desc(Promotion.priority)).all()
+            
+            # Get expired promotions for user
+            expired_rows = self.db.query(Promotion, usage_count).options(raiseload('*')).outerjoin(
+                usage, usage.c.promotion_id == Promotion.promotion_id
+            ).filter(
                 and_(
                     Promotion.is_active == True,
-                    Promotion.start_date <= datetime.utcnow(),
-                    Promotion.end_date >= datetime.utcnow(),
-                    Promotion.status == "active"
+                    Promotion.end_date < now
                 )
-            ).order_by(desc(Promotion.priority)).all()
+            ).order_by(desc(Promotion.end_date)).limit(10).all()
+            
+            usage_counts = {promotion.promotion_id: count for promotion, count in active_rows + expired_rows}
+            active_promotions = [promotion for promotion, _ in active_rows]
+            expired_promotions_query = [promotion for promotion, _ in expired_rows]
             
             available_promotions = []
             applied_promotions = []
@@ -405,20 +506,12 @@ class PromotionService:
             
             for promotion in active_promotions:
                 # Check if user is eligible
-                if self._is_user_eligible(promotion, user_id, user_groups=[], purchase_history={}):
-                    user_promotion = self._build_user_promotion_response(promotion, user_id)
+                if self._is_user_eligible(promotion, user_id, [], {}, usage_counts):
+                    user_promotion = self._build_user_promotion_response(promotion, user_id, usage_counts)
                     available_promotions.append(user_promotion)
             
-            # Get expired promotions for user
-            expired_promotions_query = self.db.query(Promotion).filter(
-                and_(
-                    Promotion.is_active == True,
-                    Promotion.end_date < datetime.utcnow()
-                )
-            ).order_by(desc(Promotion.end_date)).limit(10).all()
-            
             for promotion in expired_promotions_query:
-                user_promotion = self._build_user_promotion_response(promotion, user_id)
+                user_promotion = self._build_user_promotion_response(promotion, user_id, usage_counts)
                 expired_promotions.append(user_promotion)
             
             # Calculate totals
@@ -447,7 +540,11 @@ class PromotionService:
     
     def _build_promotion_response(self, promotion: Promotion) -> PromotionResponse:
         """Build promotion response from database model"""
-        return PromotionResponse(
+        return PromotionResponse(**self._promotion_response_data(promotion))
+    
+    def _promotion_response_data(self, promotion: Promotion) -> Dict[str, Any]:
+        """Collect the promotion response fields from a database model"""
+        return dict(
             promotion_id=str(promotion.promotion_id),
             promotion_name=promotion.promotion_name,
             description=promotion.description,
@@ -477,14 +574,19 @@ class PromotionService:
             updated_at=promotion.updated_at
         )
     
-    def _build_user_promotion_response(self, promotion: Promotion, user_id: str) -> UserPromotionResponse:
+    def _build_user_promotion_response(
+        self,
+        promotion: Promotion,
+        user_id: str,
+        usage_counts: Optional[Dict[uuid.UUID, int]] = None
+    ) -> UserPromotionResponse:
         """Build user-specific promotion response"""
         # Get current usage for user
-        current_usage = self._get_user_promotion_usage(str(promotion.promotion_id), user_id)
+        current_usage = self._resolve_user_promotion_usage(promotion, user_id, usage_counts)
         remaining_usage = max(0, (promotion.usage_limit_per_user or 0) - current_usage)
         
         # Check eligibility
-        is_eligible = self._is_user_eligible(promotion, user_id, [], {})
+        is_eligible = self._is_user_eligible(promotion, user_id, [], {}, usage_counts)
         eligibility_reason = "User is eligible" if is_eligible else "User does not meet eligibility criteria"
         
         # Estimate savings (placeholder calculation)
@@ -510,43 +612,80 @@ class PromotionService:
             estimated_savings=estimated_savings
         )
     
-    def _get_categories_with_promotions(self, promotions: List[Promotion]) -> List[str]:
-        """Get list of categories that have active promotions"""
+    def _get_category_names(self, category_ids: Set[str]) -> List[str]:
+        """Get the names of the given categories"""
+        if not category_ids:
+            return []
+        
+        categories = self.db.query(Category.category_name).filter(Category.category_id.in_(list(category_ids))).all()
+        return [cat.category_name for cat in categories]
+    
+    def _summarize_active_promotions(self, promotions: List[Promotion]) -> Tuple[Set[str], ActivePromotionsSummary]:
+        """Collect targeted category IDs and build the summary of active promotions in a single pass"""
         category_ids = set()
+        promotion_types = set()
+        total_discount_value = 0.0
+        priority_sum = 0
+        
         for promotion in promotions:
             if promotion.applicable_categories:
                 category_ids.update(promotion.applicable_categories)
-        
-        # Get category names
-        categories = self.db.query(Category).filter(Category.category_id.in_(list(category_ids))).all()
-        return [cat.category_name for cat in categories]
+            promotion_types.add(promotion.promotion_type)
+            total_discount_value += float(promotion.discount_value)
+            priority_sum += promotion.priority
+        
+        summary = ActivePromotionsSummary(
+            total_promotions=len(promotions),
+            total_discount_value=total_discount_value,
+            promotion_types=list(promotion_types),
+            average_priority=priority_sum / len(promotions) if promotions else 0
+        )
+        return category_ids, summary
     
-    def _build_active_promotions_summary(self, promotions: List[Promotion]) -> Dict[str, Any]:
-        """Build summary of active promotions"""
-        total_discount_value = sum(promotion.discount_value for promotion in promotions)
-        promotion_types = list(set(promotion.promotion_type for promotion in promotions))
-        
-        return {
-            "total_promotions": len(promotions),
-            "total_discount_value": total_discount_value,
-            "promotion_types": promotion_types,
-            "average_priority": sum(promotion.priority for promotion in promotions) / len(promotions) if promotions else 0
-        }
-    
-    def _get_user_specific_promotions(self, user_id: str, promotions: List[Promotion]) -> List[PromotionResponse]:
-        """Get promotions specific to a user"""
+    def _get_user_specific_promotions(
+        self,
+        user_id: str,
+        promotions: List[Promotion],
+        promotion_responses: List[PromotionResponse]
+    ) -> List[PromotionResponse]:
+        """Get promotions specific to a user, reusing the responses already built for them"""
+        usage_counts = self._get_user_promotion_usage_counts(
+            user_id, [promotion.promotion_id for promotion in promotions]
+        )
         user_specific = []
-        for promotion in promotions:
-            if self._is_user_eligible(promotion, user_id, [], {}):
-                user_specific.append(self._build_promotion_response(promotion))
+        for promotion, promotion_response in zip(promotions, promotion_responses):
+            if self._is_user_eligible(promotion, user_id, [], {}, usage_counts):
+                user_specific.append(promotion_response)
         return user_specific
     
+    def _build_eligibility_filter(self, user_groups: List[str]):
+        """SQL predicate for the user-independent parts of promotion eligibility, with the current time bound as `now`"""
+        if user_groups:
+            group_match = Promotion.user_groups.op('&&')(bindparam('user_groups', user_groups, type_=ARRAY(String)))
+        else:
+            group_match = false()
+        
+        return and_(
+            *_active_promotion_criteria(False, False),
+            or_(
+                Promotion.user_groups.is_(None),
+                func.cardinality(Promotion.user_groups) == 0,
+                group_match
+            ),
+            or_(
+                Promotion.total_usage_limit.is_(None),
+                Promotion.total_usage_limit == 0,
+                func.coalesce(Promotion.current_usage_count, 0) < Promotion.total_usage_limit
+            )
+        )
+    
     def _is_user_eligible(
         self,
         promotion: Promotion,
         user_id: str,
         user_groups: List[str],
-        purchase_history: Dict[str, Any]
+        purchase_history: Dict[str, Any],
+        usage_counts: Optional[Dict[uuid.UUID, int]] = None
     ) -> bool:
         """Check if a user is eligible for a promotion"""
         # Check user groups
@@ -555,7 +694,7 @@ class PromotionService:
         
         # Check usage limits
         if promotion.usage_limit_per_user:
-            current_usage = self._get_user_promotion_usage(str(promotion.promotion_id), user_id)
+            current_usage = self._resolve_user_promotion_usage(promotion, user_id, usage_counts)
             if current_usage >= promotion.usage_limit_per_user:
                 return False
         
@@ -577,34 +716,39 @@ class PromotionService:
         category_ids: List[str]
     ) -> bool:
         """Check if a promotion applies to cart items"""
-        # Check if any products/categories match
-        has_applicable_items = False
-        
-        # Check products
-        if promotion.applicable_products:
-            has_applicable_items = any(pid in promotion.applicable_products for pid in product_ids)
-        
-        # Check categories
-        if promotion.applicable_categories:
-            has_applicable_items = has_applicable_items or any(cid in promotion.applicable_categories for cid in category_ids)
-        
-        # If no specific products/categories specified, promotion applies to all
-        if not promotion.applicable_products and not promotion.applicable_categories:
-            has_applicable_items = True
+        # Hash lookups against the cart instead of scanning the promotion lists per cart item
+        cart_products = frozenset(product_ids)
+        cart_categories = frozenset(category_ids)
+        
+        # If no specific products/categories specified, promotion applies to all;
+        # otherwise stop at the first matching product or category
+        if promotion.applicable_products or promotion.applicable_categories:
+            included = (
+                bool(promotion.applicable_products) and not cart_products.isdisjoint(promotion.applicable_products)
+            ) or (
+                bool(promotion.applicable_categories) and not cart_categories.isdisjoint(promotion.applicable_categories)
+            )
+            if not included:
+                return False
         
         # Check exclusions
-        if promotion.excluded_products:
-            has_applicable_items = has_applicable_items and not any(pid in promotion.excluded_products for pid in product_ids)
+        if promotion.excluded_products and not cart_products.isdisjoint(promotion.excluded_products):
+            return False
         
-        if promotion.excluded_categories:
-            has_applicable_items = has_applicable_items and not any(cid in promotion.excluded_categories for cid in category_ids)
+        if promotion.excluded_categories and not cart_categories.isdisjoint(promotion.excluded_categories):
+            return False
         
-        return has_applicable_items
+        return True
     
-    def _check_usage_limits(self, promotion: Promotion, user_id: str) -> bool:
+    def _check_usage_limits(
+        self,
+        promotion: Promotion,
+        user_id: str,
+        usage_counts: Optional[Dict[uuid.UUID, int]] = None
+    ) -> bool:
         """Check if user can use this promotion based on usage limits"""
         if promotion.usage_limit_per_user:
-            current_usage = self._get_user_promotion_usage(str(promotion.promotion_id), user_id)
+            current_usage = self._resolve_user_promotion_usage(promotion, user_id, usage_counts)
             if current_usage >= promotion.usage_limit_per_user:
                 return False
         
@@ -629,41 +773,56 @@ class PromotionService:
         
         return discount_amount, discount_percentage
     
-    def _calculate_item_discount(self, promotion: Promotion, item: Dict[str, Any]) -> float:
+    def _calculate_item_discount(self, terms: DiscountTerms, item: PromotionCartItem) -> float:
         """Calculate discount for a specific item"""
-        item_price = item.get('price', 0)
-        item_quantity = item.get('quantity', 1)
-        total_item_price = item_price * item_quantity
-        
-        if promotion.discount_type == "percentage":
-            discount_amount = (total_item_price * promotion.discount_value) / 100
-            if promotion.max_discount_amount:
-                discount_amount = min(discount_amount, promotion.max_discount_amount)
-        elif promotion.discount_type == "fixed_amount":
-            discount_amount = min(promotion.discount_value, total_item_price)
+        total_item_price = item.price * item.quantity
+        
+        if terms.discount_type == "percentage":
+            discount_amount = (total_item_price * terms.discount_value) / 100
+            if terms.max_discount_amount:
+                discount_amount = min(discount_amount, terms.max_discount_amount)
+        elif terms.discount_type == "fixed_amount":
+            discount_amount = min(terms.discount_value, total_item_price)
         else:
             discount_amount = 0.0
         
         return discount_amount
     
-    def _is_item_eligible_for_promotion(self, promotion: Promotion, item: Dict[str, Any]) -> bool:
+    def _discount_terms(self, promotion: Promotion) -> DiscountTerms:
+        """Convert a promotion's Numeric discount columns to floats once, before pricing each cart item"""
+        return DiscountTerms(
+            discount_type=promotion.discount_type,
+            discount_value=float(promotion.discount_value),
+            max_discount_amount=float(promotion.max_discount_amount) if promotion.max_discount_amount else None
+        )
+    
+    def _promotion_targets(self, promotion: Promotion) -> PromotionTargets:
+        """Convert a promotion's target lists to sets once, before checking each cart item"""
+        return PromotionTargets(
+            applicable_products=frozenset(promotion.applicable_products or ()),
+            applicable_categories=frozenset(promotion.applicable_categories or ()),
+            excluded_products=frozenset(promotion.excluded_products or ()),
+            excluded_categories=frozenset(promotion.excluded_categories or ())
+        )
+    
+    def _is_item_eligible_for_promotion(self, targets: PromotionTargets, item: PromotionCartItem) -> bool:
         """Check if a cart item is eligible for a promotion"""
-        product_id = item.get('product_id')
-        category_id = item.get('category_id')
+        product_id = item.product_id
+        category_id = item.category_id
         
         # Check if product is excluded
-        if promotion.excluded_products and product_id in promotion.excluded_products:
+        if product_id in targets.excluded_products:
             return False
         
-        if promotion.excluded_categories and category_id in promotion.excluded_categories:
+        if category_id in targets.excluded_categories:
             return False
         
         # Check if product is included
-        if promotion.applicable_products:
-            return product_id in promotion.applicable_products
+        if targets.applicable_products:
+            return product_id in targets.applicable_products
         
-        if promotion.applicable_categories:
-            return category_id in promotion.applicable_categories
+        if targets.applicable_categories:
+            return category_id in targets.applicable_categories
         
         # If no specific products/categories specified, item is eligible
         return True
@@ -674,12 +833,51 @@ class PromotionService:
         # For now, return True as placeholder
         return True
     
-    def _get_user_promotion_usage(self, promotion_id: str, user_id: str) -> int:
+    def _get_user_promotion_usage(self, promotion_id: uuid.UUID, user_id: str) -> int:
         """Get current usage count for a user and promotion"""
-        # This would typically query a promotion_usage table
-        # For now, return 0 as placeholder
-        return 0
+        return self._get_user_promotion_usage_counts(user_id, [promotion_id]).get(promotion_id, 0)
+    
+    def _get_user_promotion_usage_counts(self, user_id: str, promotion_ids: List[Any]) -> Dict[uuid.UUID, int]:
+        """Get a user's usage count for each of several promotions in a single query, keyed by promotion UUID"""
+        if not promotion_ids:
+            return {}
+        
+        usage = self.db.query(
+            Order.promotion_id,
+            func.count(Order.order_id).label('usage_count')
+        ).filter(
+            Order.user_id == user_id,
+            Order.promotion_id.in_(promotion_ids)
+        ).group_by(Order.promotion_id).all()
+        
+        return {row.promotion_id: row.usage_count for row in usage}
+    
+    def _user_promotion_usage_subquery(self, user_id: str):
+        """Per-promotion order counts for a user, for joining against promotions"""
+        return self.db.query(
+            Order.promotion_id,
+            func.count(Order.order_id).label('usage_count')
+        ).filter(
+            Order.user_id == user_id,
+            Order.promotion_id.isnot(None)
+        ).group_by(Order.promotion_id).subquery()
+    
+    def _resolve_user_promotion_usage(
+        self,
+        promotion: Promotion,
+        user_id: str,
+        usage_counts: Optional[Dict[uuid.UUID, int]]
+    ) -> int:
+        """Look up a user's promotion usage in prefetched counts, querying when none were given"""
+        if usage_counts is None:
+            return self._get_user_promotion_usage(promotion.promotion_id, user_id)
+        return usage_counts.get(promotion.promotion_id, 0)
     
+    @cachetools.cached(
+        _terms_cache,
+        key=lambda self, promotion: hashkey(promotion.promotion_id, promotion.updated_at),
+        lock=_terms_lock
+    )
     def _build_terms_and_conditions(self, promotion: Promotion) -> List[str]:
         """Build terms and conditions for a promotion"""
         terms = []
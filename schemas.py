@@ -3,10 +3,12 @@ Pydantic schemas for Labanita API.
 Provides data validation, request bodies, and response models for all API endpoints.
 """
 
+import time
 from datetime import datetime
 from typing import List, Optional, Union
 from decimal import Decimal
-from pydantic import BaseModel, Field, validator, UUID4
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, validator, UUID4
 from enum import Enum
 
 
@@ -90,9 +92,7 @@ class UserResponse(UserBase, TimestampBase):
     points_balance: int
     is_active: bool
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, defer_build=True)
 
 
 # ========================================
@@ -128,9 +128,7 @@ class CategoryResponse(CategoryBase, TimestampBase):
     """Schema for category response."""
     category_id: UUID4
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, defer_build=True)
 
 
 # ========================================
@@ -177,9 +175,7 @@ class ProductResponse(ProductBase, TimestampBase):
     category_id: UUID4
     category: Optional[CategoryResponse] = None
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, defer_build=True)
 
 
 class ProductWithCategory(ProductResponse):
@@ -229,15 +225,25 @@ class AddressResponse(AddressBase, TimestampBase):
     address_id: UUID4
     user_id: UUID4
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, defer_build=True)
 
 
 # ========================================
 # PAYMENT METHOD SCHEMAS
 # ========================================
 
+# Current year and the monotonic time it was read, refreshed at most hourly
+_CURRENT_YEAR_CACHE = [datetime.now().year, time.monotonic()]
+
+
+def _current_year() -> int:
+    """Get the current year without reading the clock on every validation."""
+    now = time.monotonic()
+    if now - _CURRENT_YEAR_CACHE[1] > 3600:
+        _CURRENT_YEAR_CACHE[:] = [datetime.now().year, now]
+    return _CURRENT_YEAR_CACHE[0]
+
+
 class PaymentMethodBase(BaseModel):
     """Base payment method schema with common fields."""
     payment_type: PaymentTypeEnum
@@ -250,7 +256,7 @@ class PaymentMethodBase(BaseModel):
 
     @validator('expiry_year')
     def validate_expiry_year(cls, v):
-        if v and v < datetime.now().year:
+        if v and v < _current_year():
             raise ValueError('Expiry year must be current year or later')
         return v
 
@@ -276,9 +282,7 @@ class PaymentMethodResponse(PaymentMethodBase, TimestampBase):
     payment_method_id: UUID4
     user_id: UUID4
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, defer_build=True)
 
 
 # ========================================
@@ -331,9 +335,7 @@ class PromotionResponse(PromotionBase, TimestampBase):
     promotion_id: UUID4
     usage_count: int
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, defer_build=True)
 
 
 # ========================================
@@ -359,9 +361,7 @@ class OrderItemResponse(OrderItemBase, TimestampBase):
     product_id: UUID4
     product: Optional[ProductResponse] = None
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, defer_build=True)
 
 
 # ========================================
@@ -412,9 +412,7 @@ class OrderResponse(OrderBase, TimestampBase):
     promotion: Optional[PromotionResponse] = None
     order_items: List[OrderItemResponse] = []
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, defer_build=True)
 
 
 class OrderDetails(OrderResponse):
@@ -452,9 +450,7 @@ class CartItemResponse(CartItemBase, TimestampBase):
     product_id: UUID4
     product: Optional[ProductResponse] = None
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, defer_build=True)
 
 
 # ========================================
@@ -477,9 +473,7 @@ class OrderStatusHistoryResponse(OrderStatusHistoryBase, TimestampBase):
     status_history_id: UUID4
     order_id: UUID4
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, defer_build=True)
 
 
 # ========================================
@@ -532,9 +526,7 @@ class ProductOfferResponse(ProductOfferBase, TimestampBase):
     offer_id: UUID4
     product_id: UUID4
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, defer_build=True)
 
 
 # ========================================
@@ -565,8 +557,27 @@ class CartSummary(BaseModel):
     delivery_fee: Decimal = Decimal('0')
     total_amount: Decimal
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
+
+# ========================================
+# BATCH SERIALIZATION
+# ========================================
+
+@lru_cache(maxsize=None)
+def list_adapter(model: type) -> TypeAdapter:
+    """Get the shared list validator for a response model, building it on first use."""
+    return TypeAdapter(List[model])
+
+
+def serialize_products(products) -> List[ProductResponse]:
+    """Convert Product ORM rows to responses in a single validator call."""
+    return list_adapter(ProductResponse).validate_python(products, from_attributes=True)
+
+
+def serialize_categories(categories) -> List[CategoryResponse]:
+    """Convert Category ORM rows to responses in a single validator call."""
+    return list_adapter(CategoryResponse).validate_python(categories, from_attributes=True)
 
 
 # ========================================
@@ -587,8 +598,7 @@ class PaginatedResponse(BaseModel):
     size: int
     pages: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # ========================================
@@ -608,4 +618,27 @@ class ValidationErrorResponse(BaseModel):
     error: str = "Validation Error"
     message: str
     field_errors: List[dict]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
\ No newline at end of file
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+
+# ========================================
+# SCHEMA BUILD
+# ========================================
+
+# Response models declare defer_build, so their validators are built here at startup instead of on import
+RESPONSE_MODELS = (
+    UserResponse, CategoryResponse, ProductResponse, ProductWithCategory,
+    AddressResponse, PaymentMethodResponse, PromotionResponse,
+    OrderItemResponse, OrderResponse, OrderDetails, CartItemResponse,
+    OrderStatusHistoryResponse, ProductOfferResponse,
+    UserWithDetails, CategoryWithProducts, ProductWithOffers,
+    CartSummary, PaginatedResponse
+)
+
+
+def build_response_models() -> None:
+    """Build the deferred response model validators and the list adapters once."""
+    for model in RESPONSE_MODELS:
+        model.model_rebuild(force=True)
+    list_adapter(ProductResponse)
+    list_adapter(CategoryResponse)
\ No newline at end of file
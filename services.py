@@ -4,9 +4,11 @@ Provides core functions for interacting with the database and implementing busin
 """
 
 import uuid
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+import threading
+from typing import Callable, List, Optional, Tuple, Union
+import cachetools
+from sqlalchemy.orm import Session, aliased, contains_eager, selectinload
+from sqlalchemy import and_, func, inspect, lambda_stmt, select, tuple_
 
 from models import Product, Category
 from schemas import ProductResponse, CategoryResponse
@@ -16,6 +18,23 @@ from schemas import ProductResponse, CategoryResponse
 # PRODUCT SERVICES
 # ========================================
 
+# Keyset cursor for product listings: the (sort_order, product_name, product_id) of the last row seen
+ProductCursor = Tuple[int, str, uuid.UUID]
+
+
+def get_product_cursor(product: Product) -> ProductCursor:
+    """
+    Build the keyset cursor that continues a product listing after the given product.
+    
+    Args:
+        product: Last product of the current page
+    
+    Returns:
+        Cursor to pass as `after` for the next page
+    """
+    return (product.sort_order, product.product_name, product.product_id)
+
+
 def get_products(
     db: Session, 
     skip: int = 0, 
@@ -24,7 +43,9 @@ def get_products(
     is_active: Optional[bool] = None,
     is_featured: Optional[bool] = None,
     is_new_arrival: Optional[bool] = None,
-    is_best_selling: Optional[bool] = None
+    is_best_selling: Optional[bool] = None,
+    after: Optional[ProductCursor] = None,
+    eager_category: bool = False
 ) -> List[Product]:
     """
     Fetch products from the database with optional filtering and pagination.
@@ -38,6 +59,8 @@ def get_products(
         is_featured: Filter by featured status
         is_new_arrival: Filter by new arrival status
         is_best_selling: Filter by best selling status
+        after: Keyset cursor from get_product_cursor; when given, skip is ignored
+        eager_category: Load each product's category in one extra IN query
     
     Returns:
         List of Product objects matching the criteria
@@ -63,12 +86,23 @@ def get_products(
     if is_best_selling is not None:
         filters.append(Product.is_best_selling == is_best_selling)
     
+    # Seek past the cursor instead of scanning and discarding offset rows
+    if after is not None:
+        filters.append(tuple_(Product.sort_order, Product.product_name, Product.product_id) > tuple_(*after))
+    
     # Apply filters if any exist
     if filters:
         query = query.filter(and_(*filters))
     
-    # Apply ordering and pagination
-    return query.order_by(Product.sort_order.asc(), Product.product_name.asc()).offset(skip).limit(limit).all()
+    # Apply ordering and pagination; product_id breaks ties so the cursor order is total
+    query = query.order_by(Product.sort_order.asc(), Product.product_name.asc(), Product.product_id.asc())
+    if after is None:
+        query = query.offset(skip)
+    
+    if eager_category:
+        query = query.options(selectinload(Product.category))
+    
+    return query.limit(limit).all()
 
 
 def get_product_by_id(db: Session, product_id: uuid.UUID) -> Optional[Product]:
@@ -82,7 +116,8 @@ def get_product_by_id(db: Session, product_id: uuid.UUID) -> Optional[Product]:
     Returns:
         Product object if found, None otherwise
     """
-    return db.query(Product).filter(Product.product_id == product_id).first()
+    stmt = lambda_stmt(lambda: select(Product).where(Product.product_id == product_id))
+    return db.execute(stmt).scalars().first()
 
 
 def get_product_by_slug(db: Session, product_slug: str) -> Optional[Product]:
@@ -96,7 +131,8 @@ def get_product_by_slug(db: Session, product_slug: str) -> Optional[Product]:
     Returns:
         Product object if found, None otherwise
     """
-    return db.query(Product).filter(Product.product_slug == product_slug).first()
+    stmt = lambda_stmt(lambda: select(Product).where(Product.product_slug == product_slug))
+    return db.execute(stmt).scalars().first()
 
 
 def get_featured_products(db: Session, limit: int = 10) -> List[Product]:
@@ -110,9 +146,10 @@ def get_featured_products(db: Session, limit: int = 10) -> List[Product]:
     Returns:
         List of featured Product objects
     """
-    return db.query(Product).filter(
+    stmt = lambda_stmt(lambda: select(Product).where(
         and_(Product.is_featured == True, Product.is_active == True)
-    ).order_by(Product.sort_order.asc(), Product.product_name.asc()).limit(limit).all()
+    ).order_by(Product.sort_order.asc(), Product.product_name.asc()).limit(limit))
+    return db.execute(stmt).scalars().all()
 
 
 def get_new_arrivals(db: Session, limit: int = 10) -> List[Product]:
@@ -126,9 +163,10 @@ def get_new_arrivals(db: Session, limit: int = 10) -> List[Product]:
     Returns:
         List of new arrival Product objects
     """
-    return db.query(Product).filter(
+    stmt = lambda_stmt(lambda: select(Product).where(
         and_(Product.is_new_arrival == True, Product.is_active == True)
-    ).order_by(Product.created_at.desc()).limit(limit).all()
+    ).order_by(Product.created_at.desc()).limit(limit))
+    return db.execute(stmt).scalars().all()
 
 
 def get_best_selling_products(db: Session, limit: int = 10) -> List[Product]:
@@ -142,46 +180,115 @@ def get_best_selling_products(db: Session, limit: int = 10) -> List[Product]:
     Returns:
         List of best selling Product objects
     """
-    return db.query(Product).filter(
+    stmt = lambda_stmt(lambda: select(Product).where(
         and_(Product.is_best_selling == True, Product.is_active == True)
-    ).order_by(Product.sort_order.asc(), Product.product_name.asc()).limit(limit).all()
+    ).order_by(Product.sort_order.asc(), Product.product_name.asc()).limit(limit))
+    return db.execute(stmt).scalars().all()
 
 
 def search_products(
     db: Session, 
     search_term: str, 
     skip: int = 0, 
-    limit: int = 100
+    limit: int = 100,
+    eager_category: bool = False
 ) -> List[Product]:
     """
-    Search products by name or description.
+    Search products by name or description using full-text search.
     
     Args:
         db: Database session
         search_term: Text to search for in product names and descriptions
         skip: Number of records to skip (for pagination)
         limit: Maximum number of records to return
+        eager_category: Load each product's category in one extra IN query
     
     Returns:
         List of Product objects matching the search criteria
     """
-    search_pattern = f"%{search_term}%"
+    # Match against the GIN-indexed search vector over name and description
+    ts_query = func.plainto_tsquery("simple", search_term)
     
-    return db.query(Product).filter(
+    query = db.query(Product)
+    if eager_category:
+        query = query.options(selectinload(Product.category))
+    
+    return query.filter(
         and_(
             Product.is_active == True,
-            (
-                Product.product_name.ilike(search_pattern) |
-                Product.description.ilike(search_pattern)
-            )
+            Product.search_vec.op("@@")(ts_query)
         )
-    ).order_by(Product.sort_order.asc(), Product.product_name.asc()).offset(skip).limit(limit).all()
+    ).order_by(
+        func.ts_rank(Product.search_vec, ts_query).desc(),
+        Product.sort_order.asc(),
+        Product.product_name.asc()
+    ).offset(skip).limit(limit).all()
 
 
 # ========================================
 # CATEGORY SERVICES
 # ========================================
 
+# Process-local cache for category lookups, which are read on every listing but rarely written
+_category_cache = cachetools.TTLCache(maxsize=1024, ttl=60)
+_category_cache_lock = threading.Lock()
+_CACHE_MISS = object()
+
+
+def clear_category_cache() -> None:
+    """
+    Drop all cached category lookups. Call after any category is created, updated or deleted.
+    """
+    with _category_cache_lock:
+        _category_cache.clear()
+
+
+def _get_cached_categories(
+    db: Session,
+    key: Tuple,
+    load: Callable[[Session], Union[Category, List[Category], None]]
+) -> Union[Category, List[Category], None]:
+    """
+    Fetch a category lookup through the process-local cache.
+    
+    Misses are loaded in a short-lived session of their own, so the cache only ever holds
+    committed rows and never takes objects away from the caller's session. Cached objects
+    are merged into the caller's session without a query, so each request gets its own
+    instances; a category the caller already holds is returned as is.
+    
+    Args:
+        db: Database session
+        key: Cache key identifying the lookup
+        load: Function running the lookup against the session it is given
+    
+    Returns:
+        The cached or freshly loaded result, attached to `db`
+    """
+    with _category_cache_lock:
+        result = _category_cache.get(key, _CACHE_MISS)
+    
+    if result is _CACHE_MISS:
+        with Session(db.get_bind()) as cache_db:
+            result = load(cache_db)
+        # A miss is not cached, so a category created by another process is found on the next lookup
+        if result is None:
+            return None
+        with _category_cache_lock:
+            _category_cache[key] = result
+    
+    if isinstance(result, list):
+        return [_attach_category(db, category) for category in result]
+    return _attach_category(db, result)
+
+
+def _attach_category(db: Session, category: Category) -> Category:
+    """Return the caller's own instance of a cached category, merging a copy in if it has none"""
+    existing = db.identity_map.get(inspect(category).identity_key)
+    if existing is not None:
+        return existing
+    return db.merge(category, load=False)
+
+
 def get_categories(
     db: Session, 
     skip: int = 0, 
@@ -221,7 +328,8 @@ def get_category_by_id(db: Session, category_id: uuid.UUID) -> Optional[Category
     Returns:
         Category object if found, None otherwise
     """
-    return db.query(Category).filter(Category.category_id == category_id).first()
+    stmt = lambda_stmt(lambda: select(Category).where(Category.category_id == category_id))
+    return _get_cached_categories(db, ("id", category_id), lambda session: session.execute(stmt).scalars().first())
 
 
 def get_category_by_slug(db: Session, category_slug: str) -> Optional[Category]:
@@ -235,7 +343,8 @@ def get_category_by_slug(db: Session, category_slug: str) -> Optional[Category]:
     Returns:
         Category object if found, None otherwise
     """
-    return db.query(Category).filter(Category.category_slug == category_slug).first()
+    stmt = lambda_stmt(lambda: select(Category).where(Category.category_slug == category_slug))
+    return _get_cached_categories(db, ("slug", category_slug), lambda session: session.execute(stmt).scalars().first())
 
 
 def get_active_categories(db: Session) -> List[Category]:
@@ -248,9 +357,10 @@ def get_active_categories(db: Session) -> List[Category]:
     Returns:
         List of active Category objects
     """
-    return db.query(Category).filter(Category.is_active == True).order_by(
+    stmt = lambda_stmt(lambda: select(Category).where(Category.is_active == True).order_by(
         Category.sort_order.asc(), Category.category_name.asc()
-    ).all()
+    ))
+    return _get_cached_categories(db, ("active",), lambda session: list(session.execute(stmt).scalars().all()))
 
 
 def get_category_with_products(
@@ -271,18 +381,32 @@ def get_category_with_products(
     Returns:
         Category object with products if found, None otherwise
     """
-    category = db.query(Category).filter(Category.category_id == category_id).first()
-    
-    if category:
-        # Load products for this category with pagination
-        products = db.query(Product).filter(
-            and_(Product.category_id == category_id, Product.is_active == True)
-        ).order_by(Product.sort_order.asc(), Product.product_name.asc()).offset(skip).limit(limit).all()
-        
-        # Set the products on the category object
-        category.products = products
+    # Number the category's active products so the requested page can be joined in the same query
+    product_page = db.query(
+        Product,
+        func.row_number().over(
+            order_by=(Product.sort_order.asc(), Product.product_name.asc())
+        ).label("row_number")
+    ).filter(
+        and_(Product.category_id == category_id, Product.is_active == True)
+    ).subquery()
+    page_product = aliased(Product, product_page)
+    
+    # The page bounds sit in the join condition so a category without products is still returned
+    categories = db.query(Category).outerjoin(
+        page_product,
+        and_(
+            page_product.category_id == Category.category_id,
+            product_page.c.row_number > skip,
+            product_page.c.row_number <= skip + limit
+        )
+    ).options(
+        contains_eager(Category.products.of_type(page_product))
+    ).filter(
+        Category.category_id == category_id
+    ).order_by(product_page.c.row_number.asc()).populate_existing().all()
     
-    return category
+    return categories[0] if categories else None
 
 
 # ========================================